@@ -27,6 +27,7 @@ python3 -m PyInstaller --noconfirm --onefile --windowed \
     --hidden-import "deep_translator" \
     --hidden-import "deep_translator.google" \
     --hidden-import "deep_translator.exceptions" \
+    --hidden-import "orjson" \
     i18n_manager_modern.py
 
 echo
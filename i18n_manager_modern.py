@@ -9,11 +9,24 @@ import flet as ft
 from pathlib import Path
 import json
 import re
-import shutil
+import bisect
+import hashlib
+import sqlite3
+import mmap
+import zipfile
+import tempfile
 from datetime import datetime
-from collections import defaultdict
+from functools import lru_cache
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from collections import defaultdict, deque
+from itertools import groupby
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
-from typing import List, Dict, Optional
+import asyncio
+import time
+from typing import List, Dict, Optional, Tuple, NamedTuple
 import sys
 import ctypes
 import os
@@ -67,8 +80,214 @@ def _infer_lang_from_locale_stem(stem: str, supported: set[str]) -> Optional[str
                 return tail
     return None
 
+@dataclass
+class ProjectScan:
+    """What a project folder contains, as far as the UI needs to know."""
+    src_dir: Optional[Path]
+    has_i18n_setup: bool = False
+    locales_dir: Optional[Path] = None
+    stems: List[str] = field(default_factory=list)
+    inferred: List[str] = field(default_factory=list)  # sorted, unique language codes
+    unknown: List[str] = field(default_factory=list)  # stems no language could be inferred from
+
+
+class Finding(NamedTuple):
+    """One hardcoded string detected in a source file."""
+    file: str
+    line: int
+    text: str
+    context: str
+
+
+def _scan_project(project_path: Path, supported: set[str]) -> ProjectScan:
+    """Locate src/, the i18n setup and its locale languages (blocking filesystem work)."""
+    src_dir = None
+    for src_name in ['src', 'app', 'client', 'frontend']:
+        src_path = project_path / src_name
+        if src_path.exists():
+            src_dir = src_path
+            break
+    if src_dir is None:
+        return ProjectScan(src_dir=None)
+    
+    i18n_config = src_dir / 'i18n' / 'config.ts'
+    locales_dir = src_dir / 'i18n' / 'locales'
+    if not (i18n_config.exists() and locales_dir.exists()):
+        return ProjectScan(src_dir=src_dir)
+    
+    # Detect languages; scandir names need no Path per entry (normcase keeps glob's
+    # case-insensitive match on Windows)
+    try:
+        with os.scandir(locales_dir) as it:
+            names = [entry.name for entry in it]
+    except OSError:
+        names = []
+    stems = [
+        name[:-5] for name in names
+        if len(name) > 5 and os.path.normcase(name).endswith('.json') and name[:-5] not in ('index', 'config')
+    ]
+    inferred_codes: list[str] = []
+    unknown_stems: list[str] = []
+    for stem in stems:
+        code = _infer_lang_from_locale_stem(stem, supported)
+        if code:
+            inferred_codes.append(code)
+        else:
+            unknown_stems.append(stem)
+    
+    return ProjectScan(
+        src_dir=src_dir,
+        has_i18n_setup=True,
+        locales_dir=locales_dir,
+        stems=stems,
+        inferred=sorted(set(inferred_codes)),
+        unknown=unknown_stems,
+    )
+
 # Import required dependencies (bundled by PyInstaller)
 from deep_translator import GoogleTranslator
+import deep_translator.google as _deep_google
+from deep_translator.exceptions import RequestError, TooManyRequests
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class _PooledRequests:
+    """Stand-in for `requests` inside deep_translator.google.
+
+    The library calls requests.get() per string, opening a new connection (and TLS
+    handshake) every time; here every get() goes through one keep-alive Session whose
+    pool is sized for the translation threads.
+    """
+    def __init__(self):
+        self.session = requests.Session()
+        # Enough connections for every translation thread (languages x workers per language)
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def get(self, *args, **kwargs):
+        return self.session.get(*args, **kwargs)
+
+    def __getattr__(self, name):
+        # Exceptions and anything else the library touches come from the real module
+        return getattr(requests, name)
+
+
+# Only patch the layout we know; other deep_translator versions keep their own requests
+if getattr(_deep_google, 'requests', None) is requests:
+    _deep_google.requests = _PooledRequests()
+
+# Rate limiting and network failures, worth retrying; anything else fails at once
+_TRANSIENT_TRANSLATE_ERRORS = (TooManyRequests, RequestError, requests.RequestException)
+
+# Optional C-accelerated JSON backend; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load_json(path: Path):
+    """Load a JSON file (orjson when available)."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _json_bytes(data) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _dump_json(path: Path, data) -> None:
+    """Write a JSON file as 2-space indented UTF-8 (orjson when available)."""
+    with open(path, 'wb') as f:
+        f.write(_json_bytes(data))
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Replace a file's contents via a temp file in the same directory, keeping its permissions."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        try:
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+        except OSError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _iter_leaves(data: dict):
+    """Yield (dotted_key, value) for every non-dict value, in document order."""
+    stack = [('', iter(data.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            full_key = f'{prefix}{key}'
+            if isinstance(value, dict):
+                stack.append((f'{full_key}.', iter(value.items())))
+                break
+            yield full_key, value
+        else:
+            stack.pop()
+
+
+# What str-mode \s matches beyond bytes-mode \s: ASCII separators 0x1c-0x1f, and the
+# Unicode spaces (NBSP, U+1680, U+2000-U+200A, U+2028/9, U+202F, U+205F, U+3000) as UTF-8
+_ASCII_SPACE_CLASS = rb' \t\n\r\x0b\x0c\x1c-\x1f'
+_UTF8_SPACES = rb'\xc2[\x85\xa0]|\xe1\x9a\x80|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]|\xe2\x81\x9f|\xe3\x80\x80'
+
+
+def _utf8_pattern(pattern: str) -> bytes:
+    """Turn an ASCII str pattern into a bytes pattern for raw UTF-8 input, keeping \\s Unicode-aware.
+
+    Bytes-mode \\s only knows ASCII whitespace, so each \\s (bare or inside a [...] class)
+    becomes an alternation that also accepts the UTF-8 encoded Unicode spaces.
+    """
+    out = []
+    i = 0
+    while i < len(pattern):
+        if pattern[i] == '\\':
+            token = pattern[i:i + 2]
+            out.append(b'(?:[' + _ASCII_SPACE_CLASS + b']|' + _UTF8_SPACES + b')' if token == r'\s' else token.encode('ascii'))
+            i += 2
+        elif pattern[i] == '[':
+            # A leading ']' (after an optional '^') is a literal, not the end of the class
+            end = i + 1
+            if pattern[end] == '^':
+                end += 1
+            if pattern[end] == ']':
+                end += 1
+            tokens = list(pattern[i + 1:end])
+            while pattern[end] != ']':
+                step = 2 if pattern[end] == '\\' else 1
+                tokens.append(pattern[end:end + step])
+                end += step
+            if r'\s' in tokens:
+                if tokens[0] == '^':
+                    raise ValueError(f"negated class with \\s is not supported: {pattern[i:end + 1]}")
+                # Expanded in place, so the neighbouring items keep their meaning
+                body = b''.join(_ASCII_SPACE_CLASS if t == r'\s' else t.encode('ascii') for t in tokens)
+                out.append(b'(?:[' + body + b']|' + _UTF8_SPACES + b')')
+            else:
+                out.append(b'[' + ''.join(tokens).encode('ascii') + b']')
+            i = end + 1
+        else:
+            out.append(pattern[i].encode('ascii'))
+            i += 1
+    return b''.join(out)
 
 
 class I18nManager:
@@ -92,6 +311,11 @@ class I18nManager:
         'jsx_attr': r'<[^>]*?\s(?:title|alt|placeholder|aria-label|tooltip)=["\']([ A-Za-z0-9!?.,;:\'"()-]+)["\']',
     }
     
+    FILE_EXTENSIONS = (
+        'jpg', 'jpeg', 'png', 'gif', 'svg', 'webp', 'ico', 'mp4', 'mp3', 'wav', 'pdf', 'json', 'xml', 'csv',
+        'tsx', 'jsx', 'ts', 'js', 'css', 'scss', 'sass', 'less', 'html', 'md', 'txt', 'zip', 'tar', 'gz',
+    )
+    
     TECHNICAL_PATTERNS = [
         # Variable/constant patterns (stricter)
         r'^[a-z_]+$',  # lowercase_only
@@ -120,7 +344,7 @@ class I18nManager:
         r'^rgba?\(',  # rgb/rgba colors
         
         # File extensions and types
-        r'\.(jpg|jpeg|png|gif|svg|webp|ico|mp4|mp3|wav|pdf|json|xml|csv|tsx|jsx|ts|js|css|scss|sass|less|html|md|txt|zip|tar|gz)$',
+        r'\.(' + '|'.join(FILE_EXTENSIONS) + r')$',
         r'^(json|xml|csv|html|text|image|video|audio|application)$',
         
         # Already translated
@@ -146,10 +370,115 @@ class I18nManager:
         r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',  # UUIDs
     ]
     
+    # Bump when detection rules change so cached scan results are discarded
+    SCAN_CACHE_VERSION = 3
+    # Per-project cache directory, created inside the scanned project
+    SCAN_CACHE_DIR = '.i18n-cache'
+    
+    # Source files to scan and directories never descended into
+    SOURCE_EXTENSIONS = ('.tsx', '.ts', '.jsx', '.js')
+    EXCLUDED_DIRS = frozenset({'node_modules', 'dist', 'build', '.git', 'i18n'})
+    
+    # Languages translated at once, and concurrent requests within each language file
+    TRANSLATE_LANGUAGE_WORKERS = 8
+    TRANSLATE_WORKERS = 4
+    # Strings joined into one request; GoogleTranslator rejects payloads over 5000 characters
+    TRANSLATE_BATCH_SIZE = 50
+    TRANSLATE_BATCH_CHARS = 4500
+    TRANSLATE_BATCH_DELIMITER = ' ||| '
+    # Attempts per request on transient errors, waiting 0.5s, 1s, 2s, ... in between
+    TRANSLATE_ATTEMPTS = 5
+    TRANSLATE_RETRY_DELAY = 0.5
+    
+    # Substrings that mark a candidate as code rather than UI text
+    CODE_INDICATORS = [
+        '===', '!==', '==', '!=',  # Comparisons
+        '=>', '->', '...', '&&', '||',  # Operators
+        'case ', 'default:', 'switch', 'if ', 'else', 'return ',  # Keywords
+        'const ', 'let ', 'var ', 'function', 'async ', 'await ',  # Declarations
+        '.map', '.filter', '.reduce', '.find', '.forEach',  # Array methods
+        '?.', '??',  # Optional chaining
+        'import ', 'export ', 'from ',  # Modules
+        'typeof ', 'instanceof ',  # Type checking
+    ]
+    
+    # Compiled once at class load for the scanning hot path; source files are scanned as
+    # raw UTF-8 bytes and only the captured groups get decoded (_utf8_pattern keeps \s
+    # matching NBSP and the other Unicode spaces, as it did on decoded text)
+    # All contexts are matched in a single pass. A trailing '<' becomes a lookahead so a
+    # jsx_text match no longer swallows the '<' that opens the next tag's attributes;
+    # jsx_text starts at '>' and jsx_attr at '<', so the spans never overlap and the union
+    # finds exactly what one pass per context did. Each context has one capture group.
+    _SAFE_CONTEXTS_UNION = re.compile(b'|'.join(
+        b'(?:' + _utf8_pattern(p[:-1] + '(?=<)' if p.endswith('<') else p) + b')'
+        for p in SAFE_CONTEXTS.values()
+    ))
+    # Same union with plain bytes \s; identical results on files holding none of the bytes
+    # that can start an extra space (the common case), and noticeably faster
+    _SAFE_CONTEXTS_UNION_ASCII = re.compile(b'|'.join(
+        b'(?:' + (p[:-1] + '(?=<)' if p.endswith('<') else p).encode('ascii') + b')'
+        for p in SAFE_CONTEXTS.values()
+    ))
+    _EXTRA_SPACE_LEAD_RX = re.compile(rb'[\x1c-\x1f\xc2\xe1-\xe3]')
+    _SAFE_CONTEXT_BY_GROUP = {idx: name for idx, name in enumerate(SAFE_CONTEXTS, 1)}
+    # One alternation instead of a loop; each pattern is grouped so its ^/$ anchors stay local
+    _TECHNICAL_UNION = re.compile('|'.join(f'(?:{p})' for p in TECHNICAL_PATTERNS), re.IGNORECASE)
+    _CODE_INDICATORS_RX = re.compile('|'.join(re.escape(i) for i in CODE_INDICATORS), re.IGNORECASE)
+    # t('key') or t("key"); also covers {t('key')}, which contains the same call
+    _EXISTING_KEYS_RX = re.compile(rb't\(["\']([^"\']+)["\']\)')
+    _IDENTIFIER_RX = re.compile(r'^[a-z_][a-z0-9_]*$')
+    _MULTI_BRACKET_RX = re.compile(r'[{}\[\]()].*[{}\[\]()]')
+    # Plain-string forms of common technical patterns, tried before any regex;
+    # each only rejects text _TECHNICAL_UNION would reject anyway
+    _TECHNICAL_PREFIXES = ('http://', 'https://', 'www.', './', '../', 'rgb(', 'rgba(')
+    _TECHNICAL_SUBSTRINGS = ('className=', 'i18n.')
+    _FILE_SUFFIXES = tuple('.' + ext for ext in FILE_EXTENSIONS)
+    
+    # Words that make "word: ..." look like code rather than a label
+    CODE_KEYWORDS = frozenset({'case', 'default', 'switch', 'type', 'interface', 'enum'})
+    
+    # Lowercase identifiers that are still worth translating
+    COMMON_UI_WORDS = frozenset({
+        'ok', 'yes', 'no', 'save', 'cancel', 'close', 'open', 'edit',
+        'delete', 'add', 'remove', 'search', 'filter', 'clear', 'reset',
+        'submit', 'confirm', 'next', 'previous', 'back', 'forward', 'home',
+        'settings', 'help', 'about', 'logout', 'login', 'signup', 'loading',
+        'more', 'less', 'show', 'hide', 'view', 'download', 'upload', 'send',
+        'new', 'create', 'update', 'refresh', 'reload', 'copy', 'paste', 'cut'
+    })
+    
+    # Import/hook injection in _add_i18n_import
+    _REACT_IMPORT_RX = re.compile(r'(import.*from ["\']react["\'];?\n)')
+    _COMPONENT_RX = re.compile(r'(export\s+default\s+function\s+\w+\s*\([^)]*\)\s*\{)')
+    
+    # Capitalized words that seed generated key names
+    _KEY_WORD_RX = re.compile(r'\b[A-Z][a-z]+')
+    
+    # A JSX text node between two tags, for replacing detected jsx_text
+    _JSX_TEXT_NODE_RX = re.compile(r'>([^<>]*)<')
+    
+    # context -> (pattern prefix, replacement template); the escaped texts are appended per file
+    _NAMED_VALUE_PATTERNS = {
+        'jsx_attr': (r'([a-zA-Z0-9_-]+)\s*=\s*["\']', r'\1={{t("{key}")}}'),
+        'obj_property': (r'([a-zA-Z0-9_-]+)\s*:\s*["\']', r'\1: t("{key}")'),
+    }
+    
+    # Path fragment -> section; earlier fragments win wherever they appear in the path
+    SECTION_FRAGMENTS = (
+        ('nav', 'nav'), ('footer', 'footer'), ('home', 'home'), ('about', 'about'),
+        ('contact', 'contact'), ('auth', 'auth'), ('login', 'auth'), ('form', 'form'),
+        ('button', 'button'),
+    )
+    _SECTION_RX = re.compile(
+        '^(?:' + '|'.join(f'.*?({re.escape(frag)})' for frag, _ in SECTION_FRAGMENTS) + ')',
+        re.DOTALL
+    )
+    
     def __init__(self):
         self.tool_dir = Path(__file__).parent
         self.backups_dir = self.tool_dir / '.backups'
         self.temp_dir = self.tool_dir / '.temp'
+        self.translation_cache_file = self.tool_dir / '.translation_cache.sqlite'
         self.backups_dir.mkdir(exist_ok=True)
         self.temp_dir.mkdir(exist_ok=True)
         
@@ -158,12 +487,16 @@ class I18nManager:
         self.locales_dir: Optional[Path] = None
         self.selected_languages: List[str] = ['en']
         self.source_language: str = 'en'
-        self.detected_strings: List[Dict] = []
+        self.detected_strings: List[Finding] = []
         self.generated_keys: Dict[str, str] = {}
         self.has_i18n_setup = False
         self.on_progress = None
         self.framework: str = 'Unknown'  # Detected framework
         self.framework_version: str = ''  # Framework version
+        self._translation_memo: Dict[Tuple[str, str, str], str] = {}  # (source, target, text) -> translation
+        self._translator_local = threading.local()  # per-thread (source, target) -> translator
+        self._translation_db: Optional[sqlite3.Connection] = None  # opened on first use
+        self._translation_db_lock = threading.Lock()
     
     def detect_framework(self) -> Dict[str, str]:
         """Detect the JavaScript framework being used"""
@@ -175,8 +508,7 @@ class I18nManager:
             return {'name': 'Unknown', 'version': ''}
         
         try:
-            with open(package_json, 'r', encoding='utf-8') as f:
-                pkg = json.load(f)
+            pkg = _load_json(package_json)
             
             dependencies = {**pkg.get('dependencies', {}), **pkg.get('devDependencies', {})}
             
@@ -201,53 +533,202 @@ class I18nManager:
         except:
             return {'name': 'Unknown', 'version': ''}
     
-    def detect_hardcoded_text(self, source_dir: Path) -> List[Dict]:
+    def _iter_source_files(self, source_dir: Path, skip_declarations: bool = True):
+        """Yield source file paths as str, depth-first in sorted order, pruning excluded dirs"""
+        stack = [os.fspath(source_dir)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+            subdirs = []
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir():
+                    # Like os.walk, symlinked directories are listed but not followed
+                    if name not in self.EXCLUDED_DIRS and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif name.endswith(self.SOURCE_EXTENSIONS) and not (skip_declarations and name.endswith('.d.ts')):
+                    yield entry.path
+            stack.extend(reversed(subdirs))
+    
+    def detect_hardcoded_text(self, source_dir: Path) -> List[Finding]:
         """Detect hardcoded strings"""
         findings = []
-        # Scan .tsx, .ts, .jsx, .js files
-        extensions = ['*.tsx', '*.ts', '*.jsx', '*.js']
-        files = []
-        for ext in extensions:
-            files.extend(list(source_dir.rglob(ext)))
-        
-        # Exclude node_modules, dist, build, .git, and .d.ts files
-        files = [f for f in files if not any(ex in f.parts for ex in 
-                ['node_modules', 'dist', 'build', '.git', 'i18n']) and not f.name.endswith('.d.ts')]
-        
-        for idx, tsx_file in enumerate(files, 1):
-            try:
-                content = tsx_file.read_text(encoding='utf-8')
-                file_findings = self._scan_file(content, tsx_file)
-                findings.extend(file_findings)
+        # Single walk over the tree; excluded directories are pruned so they are never entered
+        # Scan .tsx, .ts, .jsx, .js files, skipping .d.ts declarations
+        files = list(self._iter_source_files(source_dir))
+        
+        # Findings of files unchanged since the last scan are reused; keys are project-relative
+        cache_file = self._scan_cache_file()
+        cached_files = self._load_scan_cache(cache_file)
+        fresh_files = {}
+        cache_key = self._scan_cache_key
+        
+        # Deduplicate at insertion time; texts are interned by _scan_file so repeats share one object
+        seen_texts = set()
+        
+        # Read and scan files on a thread pool; results come back in file order
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+            results = executor.map(lambda path: self._read_and_scan(path, cached_files.get(cache_key(path))), files)
+            for idx, (filepath, file_findings, cache_entry) in enumerate(results, 1):
+                if cache_entry is not None:
+                    fresh_files[cache_key(filepath)] = cache_entry
+                for finding in file_findings:
+                    normalized = ' '.join(finding.text.split())
+                    if normalized in seen_texts:
+                        continue
+                    seen_texts.add(normalized)
+                    findings.append(finding)
                 
                 if self.on_progress:
                     self.on_progress(idx / len(files))
-            except:
-                pass
+        
+        # Only files seen in this scan are kept, so deleted files drop out
+        if cache_file is not None:
+            self._save_scan_cache(cache_file, fresh_files)
         
         return findings
     
-    def _scan_file(self, content: str, filepath: Path) -> List[Dict]:
-        """Scan file for strings"""
+    def _read_and_scan(self, filepath: str, cached: Optional[list] = None) -> Tuple[str, List[Finding], Optional[list]]:
+        """Read one file and scan it; unreadable files yield no findings.
+
+        cached is the file's [mtime_ns, size, digest, findings] entry from the last scan;
+        the entry for this scan is returned alongside the findings (None if unreadable).
+        """
+        try:
+            st = os.stat(filepath)
+            # Same mtime and size: trust the last scan without opening the file
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return filepath, self._findings_from_cache(filepath, cached[3]), cached
+            with open(filepath, 'rb') as f:
+                # Empty files cannot be mapped, and have nothing to scan anyway
+                if st.st_size == 0:
+                    return filepath, [], [st.st_mtime_ns, 0, '', []]
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+                    # Touched but not edited (checkout, save without changes): hashing beats rescanning
+                    if cached is not None and cached[1] == st.st_size and cached[2] == digest:
+                        findings = self._findings_from_cache(filepath, cached[3])
+                    else:
+                        findings = self._scan_file(content, filepath)
+            entry = [st.st_mtime_ns, st.st_size, digest, [[f.line, f.text, f.context] for f in findings]]
+            return filepath, findings, entry
+        except:
+            return filepath, [], None
+    
+    @staticmethod
+    def _findings_from_cache(filepath: str, rows: list) -> List[Finding]:
+        """Rebuild a file's findings from its scan cache rows"""
+        file_str = sys.intern(filepath)
+        return [Finding(file_str, line, sys.intern(text), sys.intern(context)) for line, text, context in rows]
+    
+    def _scan_cache_file(self) -> Optional[Path]:
+        """Scan cache of the current project, or None when no project is open"""
+        if not self.project_path:
+            return None
+        return self.project_path / self.SCAN_CACHE_DIR / 'scan.json'
+    
+    def _scan_cache_key(self, filepath: str) -> str:
+        """Cache key of a source file: its path relative to the project, with forward slashes"""
+        return os.path.relpath(filepath, self.project_path).replace(os.sep, '/')
+    
+    def _load_scan_cache(self, cache_file: Optional[Path]) -> dict:
+        """Load per-file scan results of previous runs; a missing, unreadable or outdated cache starts empty"""
+        if cache_file is None:
+            return {}
+        try:
+            cache = _load_json(cache_file)
+            if cache.get('version') == self.SCAN_CACHE_VERSION and isinstance(cache.get('files'), dict):
+                return cache['files']
+        except:
+            pass
+        return {}
+    
+    def _save_scan_cache(self, cache_file: Path, files: dict):
+        """Persist scan results; the cache is an optimization only, so failures are ignored"""
+        try:
+            cache_dir = cache_file.parent
+            if not cache_dir.is_dir():
+                cache_dir.mkdir(parents=True)
+                # Keep the cache out of the project's version control without touching its .gitignore
+                (cache_dir / '.gitignore').write_text('*\n', encoding='utf-8')
+            _write_bytes_atomic(cache_file, _json_bytes({'version': self.SCAN_CACHE_VERSION, 'files': files}))
+        except OSError:
+            pass
+    
+    @staticmethod
+    def _decode_group(raw: bytes) -> str:
+        """Decode a captured UTF-8 group, normalizing newlines the way text-mode reads do"""
+        text = raw.decode('utf-8')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+    
+    def _scan_file(self, content: bytes, filepath: str) -> List[Finding]:
+        """Scan raw UTF-8 file content for strings.
+
+        \\s in the context patterns still matches NBSP and the other Unicode spaces, as it
+        does on decoded text; see _utf8_pattern.
+        """
+        # Every safe context needs a '<' (a text node ends at one, an attribute sits in one);
+        # files without any (utilities, types, plain .ts) cannot produce findings
+        if content.find(b'<') == -1:
+            return []
+        
         findings = []
-        existing_keys = set(re.findall(r't\(["\']([^"\']+)["\']\)', content))
-        
-        for context_name, pattern in self.SAFE_CONTEXTS.items():
-            for match in re.finditer(pattern, content):
-                text = match.group(1).strip()
-                if text and text not in existing_keys and self._is_user_facing(text):
-                    line_num = content[:match.start()].count('\n') + 1
-                    findings.append({
-                        'file': str(filepath),
-                        'line': line_num,
-                        'text': text,
-                        'context': context_name
-                    })
+        decode = self._decode_group
+        # Most files have no t() call yet; a substring test is far cheaper than the regex
+        existing_keys = (
+            {decode(m.group(1)) for m in self._EXISTING_KEYS_RX.finditer(content)}
+            if b't(' in content else set()
+        )
+        # Per-file dedupe; cross-file repeats are dropped in detect_hardcoded_text
+        seen_normalized = set()
+        
+        # Offsets of every newline, so a match's line number is one bisect away
+        newline_offsets = []
+        pos = content.find(b'\n')
+        while pos != -1:
+            newline_offsets.append(pos)
+            pos = content.find(b'\n', pos + 1)
+        
+        # Hot loop: bind attribute lookups to locals once per file
+        file_str = sys.intern(str(filepath))  # shared by this file's findings and their keys
+        is_user_facing = self._is_user_facing
+        bisect_left = bisect.bisect_left
+        add_seen = seen_normalized.add
+        append = findings.append
+        
+        # One regex pass over the bytes, bucketed so contexts are still handled in
+        # declaration order (the first context to claim a text keeps it)
+        matches_by_group = defaultdict(list)
+        union = self._SAFE_CONTEXTS_UNION if self._EXTRA_SPACE_LEAD_RX.search(content) else self._SAFE_CONTEXTS_UNION_ASCII
+        for match in union.finditer(content):
+            matches_by_group[match.lastindex].append(match)
+        
+        for group, context_name in self._SAFE_CONTEXT_BY_GROUP.items():
+            for match in matches_by_group.get(group, ()):
+                text = decode(match.group(group)).strip()
+                if text and text not in existing_keys and is_user_facing(text):
+                    normalized = ' '.join(text.split())
+                    if normalized in seen_normalized:
+                        continue
+                    add_seen(normalized)
+                    append(Finding(
+                        file_str,
+                        bisect_left(newline_offsets, match.start()) + 1,
+                        sys.intern(text),
+                        context_name
+                    ))
         
         return findings
     
-    def _is_user_facing(self, text: str) -> bool:
-        """Check if text is user-facing with improved detection"""
+    @classmethod
+    @lru_cache(maxsize=65536)
+    def _is_user_facing(cls, text: str) -> bool:
+        """Check if text is user-facing with improved detection (memoized; labels repeat across files)"""
         # Strip whitespace for analysis
         text = text.strip()
         
@@ -255,51 +736,35 @@ class I18nManager:
         if len(text) < 1 or len(text) > 500:
             return False
         
-        # CRITICAL: Reject code patterns immediately
-        code_indicators = [
-            '===', '!==', '==', '!=',  # Comparisons
-            '=>', '->', '...', '&&', '||',  # Operators
-            'case ', 'default:', 'switch', 'if ', 'else', 'return ',  # Keywords
-            'const ', 'let ', 'var ', 'function', 'async ', 'await ',  # Declarations
-            '.map', '.filter', '.reduce', '.find', '.forEach',  # Array methods
-            '?.', '??',  # Optional chaining
-            'import ', 'export ', 'from ',  # Modules
-            'typeof ', 'instanceof ',  # Type checking
-        ]
-        text_lower = text.lower()
-        for indicator in code_indicators:
-            if indicator in text or indicator.lower() in text_lower:
-                return False
-        
-        # Reject if contains multiple colons (code pattern)
-        if text.count(':') > 1:
+        # Everything up to the first accept below is a rejection, so cheapest checks go first
+        if text.startswith(cls._TECHNICAL_PREFIXES) or text.lower().endswith(cls._FILE_SUFFIXES):
             return False
+        for fragment in cls._TECHNICAL_SUBSTRINGS:
+            if fragment in text:
+                return False
         
-        # Reject if has colon but not at the end (like "case 'value':")
-        if ':' in text and not text.endswith(':'):
+        colon_pos = text.find(':')
+        if colon_pos != -1:
+            # Reject if contains multiple colons (code pattern)
+            if text.find(':', colon_pos + 1) != -1:
+                return False
+            # Reject if has colon but not at the end (like "case 'value':")
             # Allow "Error: message" style but reject "case 'value':" style
-            colon_pos = text.index(':')
-            before_colon = text[:colon_pos].strip()
-            # If what's before colon is a code keyword, reject
-            if before_colon.lower() in ['case', 'default', 'switch', 'type', 'interface', 'enum']:
+            if colon_pos != len(text) - 1 and text[:colon_pos].strip().lower() in cls.CODE_KEYWORDS:
                 return False
         
+        # CRITICAL: Reject code patterns (single case-insensitive scan)
+        if cls._CODE_INDICATORS_RX.search(text):
+            return False
+        
         # Reject if it looks like a code identifier (all lowercase, underscores, no spaces)
-        if re.match(r'^[a-z_][a-z0-9_]*$', text):
-            # Exception: common UI words
-            common_ui_words = {'ok', 'yes', 'no', 'save', 'cancel', 'close', 'open', 'edit', 
-                               'delete', 'add', 'remove', 'search', 'filter', 'clear', 'reset',
-                               'submit', 'confirm', 'next', 'previous', 'back', 'forward', 'home',
-                               'settings', 'help', 'about', 'logout', 'login', 'signup', 'loading',
-                               'more', 'less', 'show', 'hide', 'view', 'download', 'upload', 'send',
-                               'new', 'create', 'update', 'refresh', 'reload', 'copy', 'paste', 'cut'}
-            if text.lower() not in common_ui_words:
-                return False
+        # Exception: common UI words
+        if cls._IDENTIFIER_RX.match(text) and text.lower() not in cls.COMMON_UI_WORDS:
+            return False
         
         # Check technical patterns (fastest rejection)
-        for pattern in self.TECHNICAL_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return False
+        if cls._TECHNICAL_UNION.search(text):
+            return False
         
         # Single character: accept only if it's a letter or common UI symbol
         if len(text) == 1:
@@ -312,7 +777,7 @@ class I18nManager:
             if alpha_chars < len(text) * 0.4:
                 return False
             # Reject if it looks like code (multiple brackets/braces)
-            if re.search(r'[{}\[\]()].*[{}\[\]()]', text):
+            if cls._MULTI_BRACKET_RX.search(text):
                 return False
             return True
         
@@ -328,13 +793,13 @@ class I18nManager:
         # Reject everything else (lowercase single words not in common list)
         return False
     
-    def _deduplicate_strings(self, strings: List[Dict]) -> List[Dict]:
+    def _deduplicate_strings(self, strings: List[Finding]) -> List[Finding]:
         """Remove duplicate texts, keeping first occurrence"""
         seen_texts = {}
         deduplicated = []
         
         for string_info in strings:
-            text = string_info['text'].strip()
+            text = string_info.text.strip()
             # Normalize whitespace for comparison
             normalized = ' '.join(text.split())
             
@@ -348,7 +813,7 @@ class I18nManager:
         
         return deduplicated
     
-    def generate_translation_keys(self, strings: List[Dict]) -> Dict[str, Dict]:
+    def generate_translation_keys(self, strings: List[Finding]) -> Dict[str, Dict]:
         """Generate keys from strings"""
         # Deduplicate first to prevent duplicate keys
         strings = self._deduplicate_strings(strings)
@@ -357,11 +822,11 @@ class I18nManager:
         used_keys = set()
         
         for idx, string_info in enumerate(strings, 1):
-            text = string_info['text']
-            filepath = Path(string_info['file'])
+            text = string_info.text
+            filepath = Path(string_info.file)
             section = self._determine_section(filepath)
             
-            words = re.findall(r'\b[A-Z][a-z]+', text)
+            words = self._KEY_WORD_RX.findall(text)
             key_base = ''.join(word.lower() for word in words[:3]) or 'text'
             
             key_name = key_base
@@ -375,8 +840,8 @@ class I18nManager:
             
             mapping[full_key] = {
                 'text': text,
-                'file': str(filepath),
-                'context': string_info['context'],
+                'file': sys.intern(str(filepath)),
+                'context': string_info.context,
                 'section': section,
                 'key_name': key_name
             }
@@ -388,18 +853,15 @@ class I18nManager:
     
     def _determine_section(self, filepath: Path) -> str:
         """Determine section from path"""
-        path_lower = str(filepath).lower()
-        
-        sections = {
-            'nav': 'nav', 'footer': 'footer', 'home': 'home', 'about': 'about',
-            'contact': 'contact', 'auth': 'auth', 'login': 'auth', 'form': 'form',
-            'button': 'button'
-        }
-        
-        for key, section in sections.items():
-            if key in path_lower:
-                return section
-        
+        return self._section_for_path(str(filepath))
+    
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _section_for_path(cls, path: str) -> str:
+        """Determine section from a path string (memoized, paths repeat across findings)"""
+        match = cls._SECTION_RX.match(path.lower())
+        if match:
+            return cls.SECTION_FRAGMENTS[match.lastindex - 1][1]
         return 'common'
     
     def sync_translation_keys(self):
@@ -412,31 +874,33 @@ class I18nManager:
         if not base_file.exists():
             return
         
-        with open(base_file, 'r', encoding='utf-8') as f:
-            base_data = json.load(f)
+        base_data = _load_json(base_file)
         
         for lang_file in self.locales_dir.glob('*.json'):
             if lang_file.stem == base_lang:
                 continue
             
-            with open(lang_file, 'r', encoding='utf-8') as f:
-                lang_data = json.load(f)
+            lang_data = _load_json(lang_file)
             
             synced = self._sync_nested_dict(base_data, lang_data, lang_file.stem)
             
-            with open(lang_file, 'w', encoding='utf-8') as f:
-                json.dump(synced, f, indent=2, ensure_ascii=False)
+            # Already in sync: skip the rewrite
+            if synced != lang_data:
+                _dump_json(lang_file, synced)
     
     def _sync_nested_dict(self, source: dict, target: dict, lang: str) -> dict:
         """Sync nested dictionaries"""
         result = {}
-        
-        for key, value in source.items():
-            if isinstance(value, dict):
-                target_value = target.get(key, {})
-                result[key] = self._sync_nested_dict(value, target_value, lang)
-            else:
-                result[key] = target.get(key, f'[SRC] {value}')
+        stack = [(source, target, result)]
+        
+        while stack:
+            src, tgt, res = stack.pop()
+            for key, value in src.items():
+                if isinstance(value, dict):
+                    res[key] = {}
+                    stack.append((value, tgt.get(key, {}), res[key]))
+                else:
+                    res[key] = tgt.get(key, f'[SRC] {value}')
         
         return result
     
@@ -449,18 +913,10 @@ class I18nManager:
         stats = {}
         
         for lang_file in self.locales_dir.glob('*.json'):
-            with open(lang_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json(lang_file)
             
             # Flatten the nested structure
-            all_values = []
-            def flatten(d, prefix=''):
-                for k, v in d.items():
-                    if isinstance(v, dict):
-                        flatten(v, f"{prefix}{k}.")
-                    else:
-                        all_values.append((f"{prefix}{k}", v))
-            flatten(data)
+            all_values = list(_iter_leaves(data))
             
             # Check for duplicate values
             value_counts = {}
@@ -499,43 +955,43 @@ class I18nManager:
         total_removed = 0
         
         for lang_file in self.locales_dir.glob('*.json'):
-            with open(lang_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json(lang_file)
             
-            # Track seen values and keys to remove
+            # Track seen values
             seen_values = {}
-            keys_to_remove = []
+            pruned = False
             
             def process_dict(d, prefix=''):
-                nonlocal total_removed
+                """Remove duplicates and empty sections in one pass; returns (removed, is_empty)"""
+                nonlocal pruned
+                removed = 0
                 for k, v in list(d.items()):
                     full_key = f"{prefix}{k}"
                     if isinstance(v, dict):
-                        process_dict(v, f"{full_key}.")
+                        child_removed, child_empty = process_dict(v, f"{full_key}.")
+                        removed += child_removed
+                        if child_empty:
+                            del d[k]
+                            pruned = True
                     else:
                         # Normalize value
                         clean_value = v.replace('[SRC] ', '').strip()
                         clean_value = ' '.join(clean_value.split())
                         
                         if clean_value in seen_values:
-                            # Duplicate found - mark for removal
-                            keys_to_remove.append((d, k))
-                            total_removed += 1
+                            # Duplicate found - remove it
+                            del d[k]
+                            removed += 1
                         else:
                             seen_values[clean_value] = full_key
+                return removed, not d
             
-            process_dict(data)
+            removed, _ = process_dict(data)
             
-            # Remove duplicates
-            for parent_dict, key in keys_to_remove:
-                del parent_dict[key]
-            
-            # Clean up empty sections
-            data = {k: v for k, v in data.items() if v}  # Remove empty dicts
-            
-            # Write back
-            with open(lang_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Write back only if something was removed
+            if removed or pruned:
+                total_removed += removed
+                _dump_json(lang_file, data)
         
         return total_removed
     
@@ -552,8 +1008,7 @@ class I18nManager:
             lang_file = self.locales_dir / f'{lang}.json'
             
             if lang_file.exists():
-                with open(lang_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _load_json(lang_file)
             else:
                 data = {}
             
@@ -569,55 +1024,223 @@ class I18nManager:
                 else:
                     data[section][key_name] = f'{marker}{text}'
             
-            with open(lang_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _dump_json(lang_file, data)
 
             if self.on_progress:
                 self.on_progress(min(0.5, idx / (total_steps * 2)), f"Wrote {lang}.json")
         
-        # Auto-translate
+        # Auto-translate; each language is independent network I/O, so run them concurrently
         targets = [l for l in languages if l != source_lang]
-        translate_total = max(1, len(targets))
-        for idx, lang in enumerate(targets, 1):
-            if self.on_progress:
-                self.on_progress(0.5 + (idx - 1) / (translate_total * 2), f"Translating {lang}...")
-            self._translate_file(self.locales_dir / f'{lang}.json', lang, source_lang, marker)
-            if self.on_progress:
-                self.on_progress(0.5 + idx / (translate_total * 2), f"Translated {lang}")
+        if not targets:
+            return
+        translate_total = len(targets)
+        if self.on_progress:
+            self.on_progress(0.5, f"Translating {translate_total} language(s)...")
+        with ThreadPoolExecutor(max_workers=min(self.TRANSLATE_LANGUAGE_WORKERS, translate_total)) as executor:
+            futures = {
+                executor.submit(self._translate_file, self.locales_dir / f'{lang}.json', lang, source_lang, marker): lang
+                for lang in targets
+            }
+            for idx, future in enumerate(as_completed(futures), 1):
+                future.result()
+                if self.on_progress:
+                    self.on_progress(0.5 + idx / (translate_total * 2), f"Translated {futures[future]}")
     
     def _translate_file(self, filepath: Path, target_lang: str, source_lang: str, marker: str):
         """Translate file"""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_json(filepath)
         
         translated = self._translate_dict(data, target_lang, source_lang, marker)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(translated, f, indent=2, ensure_ascii=False)
+        _dump_json(filepath, translated)
+    
+    def _get_translator(self, source_lang: str, target_lang: str) -> GoogleTranslator:
+        """Return this thread's translator for a language pair (GoogleTranslator is not thread-safe)"""
+        cache = getattr(self._translator_local, 'cache', None)
+        if cache is None:
+            cache = self._translator_local.cache = {}
+        translator = cache.get((source_lang, target_lang))
+        if translator is None:
+            translator = GoogleTranslator(source=source_lang, target=target_lang)
+            cache[(source_lang, target_lang)] = translator
+        return translator
+    
+    def _request_translation(self, text: str, source_lang: str, target_lang: str) -> str:
+        """Send one translation request, backing off exponentially on transient errors"""
+        delay = self.TRANSLATE_RETRY_DELAY
+        for attempt in range(1, self.TRANSLATE_ATTEMPTS + 1):
+            try:
+                return self._get_translator(source_lang, target_lang).translate(text)
+            except _TRANSIENT_TRANSLATE_ERRORS:
+                if attempt == self.TRANSLATE_ATTEMPTS:
+                    raise
+                time.sleep(delay)
+                delay *= 2
+    
+    @staticmethod
+    def _translation_hash(source_lang: str, target_lang: str, text: str) -> str:
+        """Key of a translation in the on-disk cache"""
+        return hashlib.sha1(f"{source_lang}\x00{target_lang}\x00{text}".encode('utf-8')).hexdigest()
+    
+    def _open_translation_db(self) -> sqlite3.Connection:
+        """Open the on-disk translation cache; callers hold _translation_db_lock"""
+        if self._translation_db is None:
+            conn = sqlite3.connect(str(self.translation_cache_file), check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS cache (hash TEXT PRIMARY KEY, translation TEXT)')
+            self._translation_db = conn
+        return self._translation_db
+    
+    def _load_cached_translations(self, texts: List[str], source_lang: str, target_lang: str):
+        """Pull translations from previous runs into the in-memory memo"""
+        memo = self._translation_memo
+        by_hash = {
+            self._translation_hash(source_lang, target_lang, text): text
+            for text in texts if (source_lang, target_lang, text) not in memo
+        }
+        if not by_hash:
+            return
+        hashes = list(by_hash)
+        rows = []
+        try:
+            with self._translation_db_lock:
+                conn = self._open_translation_db()
+                # Stay under SQLite's bound-parameter limit
+                for start in range(0, len(hashes), 500):
+                    batch = hashes[start:start + 500]
+                    rows.extend(conn.execute(
+                        f"SELECT hash, translation FROM cache WHERE hash IN ({','.join('?' * len(batch))})",
+                        batch
+                    ).fetchall())
+        except sqlite3.Error:
+            return  # The cache is an optimization only
+        for digest, translation in rows:
+            memo[(source_lang, target_lang, by_hash[digest])] = translation
+    
+    def _store_cached_translations(self, translations: List[Tuple[str, str]], source_lang: str, target_lang: str):
+        """Persist (text, translation) pairs for later runs"""
+        if not translations:
+            return
+        rows = [
+            (self._translation_hash(source_lang, target_lang, text), translated)
+            for text, translated in translations
+        ]
+        try:
+            with self._translation_db_lock:
+                conn = self._open_translation_db()
+                with conn:
+                    conn.executemany('INSERT OR REPLACE INTO cache (hash, translation) VALUES (?, ?)', rows)
+        except sqlite3.Error:
+            pass
+    
+    def _translate_chunk(self, texts: List[str], source_lang: str, target_lang: str) -> Dict[str, str]:
+        """Translate several strings in one request; falls back to one request per string.
+
+        Strings that fail to translate are left out of the result. Once a request has used
+        up its retries the service is treated as unreachable and only memo hits are served.
+        """
+        memo = self._translation_memo
+        todo = [text for text in texts if (source_lang, target_lang, text) not in memo]
+        gave_up = False
+        if len(todo) > 1:
+            delimiter = self.TRANSLATE_BATCH_DELIMITER
+            try:
+                joined = self._request_translation(delimiter.join(todo), source_lang, target_lang)
+                parts = joined.split(delimiter.strip()) if joined else []
+            except _TRANSIENT_TRANSLATE_ERRORS:
+                gave_up = True
+                parts = []
+            except:
+                parts = []
+            # Only trust the batch when the delimiter survived translation intact
+            if len(parts) == len(todo):
+                for text, part in zip(todo, parts):
+                    memo[(source_lang, target_lang, text)] = part.strip()
+        
+        translated = {}
+        for text in texts:
+            if gave_up and (source_lang, target_lang, text) not in memo:
+                continue
+            try:
+                translated[text] = self._translate_text(text, source_lang, target_lang)
+            except _TRANSIENT_TRANSLATE_ERRORS:
+                gave_up = True
+            except:
+                pass
+        return translated
+    
+    def _translate_text(self, text: str, source_lang: str, target_lang: str) -> str:
+        """Translate one string through the memo; runs on translation pool threads"""
+        cache_key = (source_lang, target_lang, text)
+        translated = self._translation_memo.get(cache_key)
+        if translated is None:
+            translated = self._request_translation(text, source_lang, target_lang)
+            self._translation_memo[cache_key] = translated
+        return translated
     
     def _translate_dict(self, data: dict, target_lang: str, source_lang: str, marker: str) -> dict:
-        """Recursively translate dict"""
+        """Translate all marked values of a nested dict with one translator"""
         result = {}
-        
-        for key, value in data.items():
-            if isinstance(value, dict):
-                result[key] = self._translate_dict(value, target_lang, source_lang, marker)
-            elif isinstance(value, str) and value.startswith(marker):
-                original = value[len(marker):]
-                try:
-                    translator = GoogleTranslator(source=source_lang, target=target_lang)
-                    result[key] = translator.translate(original)
-                except:
-                    result[key] = value
-            else:
-                result[key] = value
+        pending = []  # (parent dict, key, original text) for every marked leaf
+        
+        # First pass: copy the structure and collect the strings to translate
+        stack = [(data, result)]
+        while stack:
+            source, target = stack.pop()
+            for key, value in source.items():
+                if isinstance(value, dict):
+                    target[key] = {}
+                    stack.append((value, target[key]))
+                else:
+                    target[key] = value
+                    if isinstance(value, str) and value.startswith(marker):
+                        pending.append((target, key, value[len(marker):]))
+        
+        if not pending:
+            return result
+        
+        # Second pass: translate each distinct string once, batched into delimiter-joined
+        # requests with a few in flight at a time; failures keep the marker
+        targets_by_text = defaultdict(list)
+        for parent, key, original in pending:
+            targets_by_text[original].append((parent, key))
+        
+        memo = self._translation_memo
+        self._load_cached_translations(list(targets_by_text), source_lang, target_lang)
+        uncached = [t for t in targets_by_text if (source_lang, target_lang, t) not in memo]
+        
+        chunks = []
+        chunk, chunk_chars = [], 0
+        for original in targets_by_text:
+            if chunk and (len(chunk) >= self.TRANSLATE_BATCH_SIZE
+                          or chunk_chars + len(original) > self.TRANSLATE_BATCH_CHARS):
+                chunks.append(chunk)
+                chunk, chunk_chars = [], 0
+            chunk.append(original)
+            chunk_chars += len(original) + len(self.TRANSLATE_BATCH_DELIMITER)
+        chunks.append(chunk)
+        
+        workers = min(self.TRANSLATE_WORKERS, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._translate_chunk, chunk, source_lang, target_lang)
+                for chunk in chunks
+            ]
+            for future in as_completed(futures):
+                for original, translated in future.result().items():
+                    for parent, key in targets_by_text[original]:
+                        parent[key] = translated
+        
+        self._store_cached_translations(
+            [(t, memo[(source_lang, target_lang, t)]) for t in uncached if (source_lang, target_lang, t) in memo],
+            source_lang, target_lang
+        )
         
         return result
     
     def replace_in_source_code(self, keys_mapping: Dict):
         """Replace hardcoded text in code"""
-        backup_dir = self.backups_dir / datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_dir.mkdir(parents=True, exist_ok=True)
+        backup_file = self.backups_dir / f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
         
         files_map = defaultdict(list)
         for full_key, info in keys_mapping.items():
@@ -627,34 +1250,45 @@ class I18nManager:
                 'context': info['context']
             })
         
-        for filepath, replacements in files_map.items():
-            filepath = Path(filepath)
-            
-            shutil.copy2(filepath, backup_dir / filepath.name)
-            
-            content = filepath.read_text(encoding='utf-8')
-            modified_content = content
-            
-            if 'useTranslation' not in content:
-                modified_content = self._add_i18n_import(modified_content)
-            
-            for repl in replacements:
-                modified_content = self._apply_replacement(
-                    modified_content,
-                    repl['text'],
-                    repl['key'],
-                    repl['context']
+        # One archive per run; paths are kept relative to the project so same-named files don't collide
+        # (fast compression level, backup speed matters more than size)
+        with zipfile.ZipFile(backup_file, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1) as backup:
+            for idx, (filepath, replacements) in enumerate(files_map.items(), 1):
+                filepath = Path(filepath)
+                
+                try:
+                    arcname = filepath.relative_to(self.project_path)
+                except (TypeError, ValueError):
+                    arcname = filepath.name
+                
+                # Read once: the backup is written from the same bytes that get edited
+                raw = filepath.read_bytes()
+                backup.writestr(
+                    zipfile.ZipInfo.from_file(filepath, arcname=str(arcname)), raw,
+                    compress_type=zipfile.ZIP_DEFLATED, compresslevel=1
                 )
-            
-            filepath.write_text(modified_content, encoding='utf-8')
+                
+                # Universal newlines, as read_text() did
+                content = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+                modified_content = content
+                
+                if 'useTranslation' not in content:
+                    modified_content = self._add_i18n_import(modified_content)
+                
+                modified_content = self._apply_replacements(modified_content, replacements)
+                
+                if modified_content != content:
+                    _write_bytes_atomic(filepath, modified_content.replace('\n', os.linesep).encode('utf-8'))
+                
+                if self.on_progress:
+                    self.on_progress(idx / len(files_map))
     
     def _add_i18n_import(self, content: str) -> str:
         """Add import and hook"""
         import_line = "import { useTranslation } from 'react-i18next';\n"
         
         if 'from "react"' in content or "from 'react'" in content:
-            content = re.sub(
-                r'(import.*from ["\']react["\'];?\n)',
+            content = self._REACT_IMPORT_RX.sub(
                 r'\1' + import_line,
                 content,
                 count=1
@@ -663,8 +1297,7 @@ class I18nManager:
             content = import_line + '\n' + content
         
         if '{ t }' not in content:
-            component_pattern = r'(export\s+default\s+function\s+\w+\s*\([^)]*\)\s*\{)'
-            match = re.search(component_pattern, content)
+            match = self._COMPONENT_RX.search(content)
             
             if match:
                 pos = match.end()
@@ -673,39 +1306,50 @@ class I18nManager:
         
         return content
     
-    def _apply_replacement(self, content: str, text: str, key: str, context: str) -> str:
-        """Apply replacement"""
-        text_escaped = re.escape(text)
-        
-        # Define replacements based on context
-        replacements = {}
+    def _apply_replacements(self, content: str, replacements: List[Dict]) -> str:
+        """Apply all replacements for one file, one pass per run of same-context replacements"""
+        # Runs keep the original order between contexts; within a run the first key for a text wins
+        for context, run in groupby(replacements, key=itemgetter('context')):
+            keys = {}
+            for repl in run:
+                keys.setdefault(repl['text'], repl['key'])
+            if context == 'jsx_text':
+                content = self._replace_text_nodes(content, keys)
+            elif context in self._NAMED_VALUE_PATTERNS:
+                content = self._replace_named_values(content, context, keys)
         
-        # JSX Text: >Text< -> >{t('key')}<
-        replacements['jsx_text'] = (f'>{text_escaped}<', f'>{{t("{key}")}}<')
+        return content
+    
+    def _replace_text_nodes(self, content: str, keys: Dict[str, str]) -> str:
+        """JSX Text: >Text< -> >{t('key')}<"""
+        # Detected texts never contain '<' or '>', so each candidate is a whole >...< run
+        # and one dict-lookup pass replaces them all; anything else falls back to str.replace
+        node_keys = {}
+        for text, key in keys.items():
+            if '<' in text or '>' in text:
+                content = content.replace(f'>{text}<', f'>{{t("{key}")}}<')
+            else:
+                node_keys[text] = key
+        if not node_keys:
+            return content
         
-        # Attributes: title="Text" -> title={t('key')}
-        # We need to match the attribute name to preserve it
-        # This is tricky with simple replace, so we use regex sub with a function or specific pattern
-        # For now, we'll try to match the specific instance
+        def replace_node(match):
+            key = node_keys.get(match.group(1))
+            return match.group(0) if key is None else f'>{{t("{key}")}}<'
         
-        if context == 'jsx_attr':
-            # Find the attribute that contains this text
-            # Pattern: attr="Text"
-            pattern = r'([a-zA-Z0-9_-]+)\s*=\s*["\']' + text_escaped + r'["\']'
-            replacement = r'\1={t("' + key + r'")}'
-            content = re.sub(pattern, replacement, content)
-            
-        elif context == 'obj_property':
-            # Object property: label: "Text" -> label: t('key')
-            pattern = r'([a-zA-Z0-9_-]+)\s*:\s*["\']' + text_escaped + r'["\']'
-            replacement = r'\1: t("' + key + r'")'
-            content = re.sub(pattern, replacement, content)
-            
-        elif context in replacements:
-            pattern, replacement = replacements[context]
-            content = re.sub(pattern, replacement, content)
+        return self._JSX_TEXT_NODE_RX.sub(replace_node, content)
+    
+    def _replace_named_values(self, content: str, context: str, keys: Dict[str, str]) -> str:
+        """Attributes: title="Text" -> title={t('key')}, or label: "Text" (obj_property)"""
+        # Every pattern contains the literal text, so a substring test rules texts out cheaply
+        present = [text for text in keys if text in content]
+        if not present:
+            return content
         
-        return content
+        # The name is captured to preserve it; all texts share one alternation
+        prefix, template = self._NAMED_VALUE_PATTERNS[context]
+        rx = re.compile(prefix + '(' + '|'.join(map(re.escape, present)) + r')["\']')
+        return rx.sub(lambda m: m.expand(template.format(key=keys[m.group(2)])), content)
     
     def validate_translations(self) -> Dict:
         """Validate translation completeness"""
@@ -717,51 +1361,34 @@ class I18nManager:
         if not base_file.exists():
             return {'error': f'No base reference file: {base_lang}.json'}
         
-        with open(base_file, 'r', encoding='utf-8') as f:
-            base_data = json.load(f)
+        base_data = _load_json(base_file)
         
-        results = {}
+        # Flatten the base once; each language is then a set lookup per key
+        base_keys = [key for key, _ in _iter_leaves(base_data)]
+        total = len(base_keys)
+        lang_files = [f for f in self.locales_dir.glob('*.json') if f.stem != base_lang]
         
-        for lang_file in self.locales_dir.glob('*.json'):
-            if lang_file.stem == base_lang:
-                continue
-            
-            with open(lang_file, 'r', encoding='utf-8') as f:
-                lang_data = json.load(f)
-            
-            missing = self._find_missing_keys(base_data, lang_data)
-            results[lang_file.stem] = {
-                'missing': missing,
-                'total': self._count_keys(base_data)
+        def load_and_diff(lang_file: Path) -> Dict:
+            present = self._flatten_keys(_load_json(lang_file))
+            return {
+                'missing': [key for key in base_keys if key not in present],
+                'total': total
             }
         
-        return results
-    
-    def _find_missing_keys(self, source: dict, target: dict, prefix: str = '') -> List[str]:
-        """Find missing keys"""
-        missing = []
-        
-        for key, value in source.items():
-            full_key = f'{prefix}.{key}' if prefix else key
-            
-            if isinstance(value, dict):
-                target_value = target.get(key, {})
-                missing.extend(self._find_missing_keys(value, target_value, full_key))
-            else:
-                if key not in target or (isinstance(target.get(key), str) and target[key].startswith('[EN] ')):
-                    missing.append(full_key)
+        if not lang_files:
+            return {}
         
-        return missing
+        # Locale loading is I/O-bound, so read the files concurrently
+        with ThreadPoolExecutor(max_workers=min(32, len(lang_files))) as executor:
+            diffs = executor.map(load_and_diff, lang_files)
+            return {lang_file.stem: diff for lang_file, diff in zip(lang_files, diffs)}
     
-    def _count_keys(self, data: dict) -> int:
-        """Count total keys"""
-        count = 0
-        for value in data.values():
-            if isinstance(value, dict):
-                count += self._count_keys(value)
-            else:
-                count += 1
-        return count
+    def _flatten_keys(self, data: dict) -> set:
+        """Dotted paths of translated leaves ('[EN] ' placeholders count as missing)"""
+        return {
+            key for key, value in _iter_leaves(data)
+            if not (isinstance(value, str) and value.startswith('[EN] '))
+        }
     
     def extract_used_translation_keys(self) -> set:
         """Extract all t() calls from source code"""
@@ -769,29 +1396,16 @@ class I18nManager:
             return set()
         
         used_keys = set()
-        # Patterns to match t('key') or t("key") or {t('key')} or {t("key")}
-        patterns = [
-            r't\(["\']([^"\']+)["\']\)',  # t('key') or t("key")
-            r'\{t\(["\']([^"\']+)["\']\)\}',  # {t('key')} or {t("key")}
-        ]
+        decode = self._decode_group
         
-        for filepath in self.src_dir.rglob('*'):
-            # Skip directories and non-code files
-            if filepath.is_dir():
-                continue
-            if filepath.suffix not in ['.ts', '.tsx', '.js', '.jsx']:
-                continue
-            
-            # Skip node_modules, dist, build, etc.
-            skip_dirs = ['node_modules', 'dist', 'build', '.git', 'i18n']
-            if any(skip in filepath.parts for skip in skip_dirs):
-                continue
-            
+        # Code files only, skipping node_modules, dist, build, etc.
+        for filepath in self._iter_source_files(self.src_dir, skip_declarations=False):
             try:
-                content = filepath.read_text(encoding='utf-8')
-                for pattern in patterns:
-                    matches = re.findall(pattern, content)
-                    used_keys.update(matches)
+                with open(filepath, 'rb') as f:
+                    content = f.read()
+                if b't(' not in content:
+                    continue
+                used_keys.update(decode(key) for key in self._EXISTING_KEYS_RX.findall(content))
             except:
                 continue
         
@@ -809,19 +1423,10 @@ class I18nManager:
         unused_by_lang = {}
         
         for lang_file in self.locales_dir.glob('*.json'):
-            with open(lang_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json(lang_file)
             
             # Flatten the locale file to get all keys
-            all_keys = []
-            def flatten(d, prefix=''):
-                for k, v in d.items():
-                    full_key = f"{prefix}.{k}" if prefix else k
-                    if isinstance(v, dict):
-                        flatten(v, full_key)
-                    else:
-                        all_keys.append(full_key)
-            flatten(data)
+            all_keys = [key for key, _ in _iter_leaves(data)]
             
             # Find unused keys
             unused = [key for key in all_keys if key not in used_keys]
@@ -846,8 +1451,7 @@ class I18nManager:
             archive_file = archive_dir / f'{lang}_unused_{timestamp}.json'
             
             # Load current locale file
-            with open(lang_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json(lang_file)
             
             # Extract unused keys to archive
             archived_data = {}
@@ -888,12 +1492,10 @@ class I18nManager:
             remove_empty(data)
             
             # Write updated locale file
-            with open(lang_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _dump_json(lang_file, data)
             
             # Write archived keys
-            with open(archive_file, 'w', encoding='utf-8') as f:
-                json.dump(archived_data, f, indent=2, ensure_ascii=False)
+            _dump_json(archive_file, archived_data)
         
         # Update .gitignore
         gitignore_path = self.project_path / '.gitignore'
@@ -913,6 +1515,56 @@ class I18nManager:
         return total_archived
 
 
+# Shared pool for the blocking manager calls behind UI actions
+_JOB_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='i18n-job')
+
+# Status card background per status kind
+_STATUS_BGCOLOR = {
+    'info': "secondaryContainer",
+    'success': "tertiaryContainer",
+    'warning': "errorContainer",
+    'running': "primaryContainer"
+}
+
+# Action card shadows; hovering swaps between the two instead of mutating one
+_CARD_SHADOW = ft.BoxShadow(
+    spread_radius=1,
+    blur_radius=10,
+    color=ft.Colors.with_opacity(0.1, ft.Colors.BLACK),
+    offset=ft.Offset(0, 4),
+)
+_CARD_SHADOW_HOVER = ft.BoxShadow(
+    spread_radius=2,
+    blur_radius=20,
+    color=ft.Colors.with_opacity(0.1, ft.Colors.BLACK),
+    offset=ft.Offset(0, 4),
+)
+_CARD_ANIMATION = ft.Animation(300, "easeOut")
+_CARD_COL = {"sm": 12, "md": 6, "xl": 4}  # Responsive grid
+
+
+def _make_status_card(icon_name: str, title: str, subtitle: str, status: str) -> ft.Card:
+    """Build a status card; the subtitle line is only added when there is one"""
+    lines = [ft.Text(title, size=14, weight=ft.FontWeight.W_500, color="onSurface")]
+    if subtitle:
+        lines.append(ft.Text(subtitle, size=12, color="onSurfaceVariant"))
+    return ft.Card(
+        elevation=1,
+        content=ft.Container(
+            content=ft.Row([
+                ft.Icon(
+                    icon_name,
+                    size=24,
+                    color="onSurfaceVariant"
+                ),
+                ft.Column(lines, spacing=2, expand=True),
+            ], spacing=12),
+            padding=16,
+            bgcolor=_STATUS_BGCOLOR.get(status, "surface"),
+        )
+    )
+
+
 def main(page: ft.Page):
     """Main application"""
     
@@ -972,24 +1624,132 @@ def main(page: ft.Page):
     # Manager instance
     manager = I18nManager()
     
+    # Languages sorted by display name, shared by the chips, checkboxes and dropdown
+    sorted_languages = sorted(manager.SUPPORTED_LANGUAGES.items(), key=lambda x: x[1])
+    supported_codes = frozenset(manager.SUPPORTED_LANGUAGES)
+    
     # State
     selected_languages = ['en']
+    selected_set = set(selected_languages)  # membership mirror of selected_languages (which keeps order)
     source_language = 'en'
     project_selected = False
 
     busy = False
 
+    # Filled once by the view builders at startup (views are never rebuilt)
     action_run_buttons: list[ft.Control] = []
+    # Run buttons start disabled (no project yet)
+    actions_enabled = False
+
+    # One scheduler for every paint: refresh() paints now, request_update() within a frame
+    # (~16 ms), schedule_op() queues a keyed mutation for that paint, and batched_updates()
+    # holds all of them back until its outermost exit
+    update_timer: Optional[threading.Timer] = None
+    update_lock = threading.Lock()
+    # Deferred control mutations keyed by what they touch; a later op replaces an earlier one.
+    # Each op carries the control it is confined to (None: it needs a page update)
+    pending_ops: Dict[object, Tuple[object, Optional[ft.Control]]] = {}
+    # Whether the next frame must diff the whole page; if not, only the ops' controls update
+    page_dirty = False
+    # Nested batches hold back every paint (timer ones included); the outermost exit paints once
+    batch_depth = 0
+
+    def flush_update():
+        """Apply pending ops and paint; inside a batch this is left to the batch's exit."""
+        nonlocal update_timer, pending_ops, page_dirty
+        with update_lock:
+            update_timer = None
+            if batch_depth:
+                return
+            ops, pending_ops = pending_ops, {}
+            paint_page, page_dirty = page_dirty, False
+        controls = {}
+        for op, control in ops.values():
+            op()
+            if control is not None:
+                controls[id(control)] = control
+        if paint_page:
+            page.update()
+        else:
+            for control in controls.values():
+                control.update()
+
+    def arm_frame(delay: float):
+        """Start the frame timer unless one is pending or a batch is open; caller holds update_lock"""
+        nonlocal update_timer
+        if update_timer is not None or batch_depth:
+            return
+        update_timer = threading.Timer(delay, flush_update)
+        update_timer.daemon = True
+        update_timer.start()
+
+    def request_update(delay: float = 0.016):
+        """Schedule a page update; requests made before it fires share one paint."""
+        nonlocal page_dirty
+        with update_lock:
+            page_dirty = True
+            arm_frame(delay)
+
+    def schedule_op(key, op, control: Optional[ft.Control] = None):
+        """Apply op at the next frame, dropping any op still pending under the same key.
+
+        An op that only touches control updates just that control, unless something else
+        in the same frame needs the whole page.
+        """
+        nonlocal page_dirty
+        with update_lock:
+            pending_ops[key] = (op, control)
+            if control is None:
+                page_dirty = True
+            arm_frame(0.016)
+
+    def op_pending(key) -> bool:
+        with update_lock:
+            return key in pending_ops
+
+    def refresh():
+        """Paint now, taking along any pending frame; deferred while inside batched_updates()."""
+        nonlocal update_timer, page_dirty
+        with update_lock:
+            page_dirty = True
+            if batch_depth:
+                return
+            if update_timer is not None:
+                update_timer.cancel()
+                update_timer = None
+        flush_update()
+
+    @contextmanager
+    def batched_updates():
+        """Group several UI mutations into a single page.update()."""
+        nonlocal batch_depth, update_timer, page_dirty
+        with update_lock:
+            batch_depth += 1
+        try:
+            yield
+        finally:
+            with update_lock:
+                batch_depth -= 1
+                outermost = batch_depth == 0
+                if outermost:
+                    page_dirty = True
+                # The frame timer's paint is folded into this one
+                if outermost and update_timer is not None:
+                    update_timer.cancel()
+                    update_timer = None
+            if outermost:
+                flush_update()
 
     def update_action_availability():
         """Enable/disable action buttons based on selection state."""
+        nonlocal actions_enabled
         enabled = bool((not busy) and project_selected and manager.project_path and manager.src_dir)
+        if enabled == actions_enabled:
+            return
+        actions_enabled = enabled
         for btn in action_run_buttons:
-            try:
-                btn.disabled = not enabled
-                btn.update()
-            except Exception:
-                pass
+            btn.disabled = not enabled
+        refresh()
     
     # UI Elements
     project_path_text = ft.Text("No project selected", color="onSurfaceVariant")
@@ -1001,49 +1761,90 @@ def main(page: ft.Page):
     
     # Status cards column
     status_cards = ft.Column(scroll=ft.ScrollMode.AUTO, spacing=8, expand=True)
+    # Newest first; older cards fall off once the cap is reached
+    recent_cards = deque(maxlen=100)
     
     # Progress bar
     progress_bar = ft.ProgressBar(visible=False, color="primary")
     progress_text = ft.Text("", size=12, color="onSurfaceVariant")
     
+    def add_status_cards(specs: List[Tuple[str, str, str, str]]) -> List[ft.Card]:
+        """Add several (icon, title, subtitle, status) cards with one paint; the last ends up on top"""
+        cards = [_make_status_card(*spec) for spec in specs]
+        recent_cards.extendleft(cards)
+        status_cards.controls = list(recent_cards)
+        refresh()
+        return cards
+
     def add_status_card(icon_name: str, title: str, subtitle: str = "", status: str = "info"):
         """Add a status card with Material Design 3 styling"""
-        colors_map = {
-            'info': "secondaryContainer",
-            'success': "tertiaryContainer",
-            'warning': "errorContainer",
-            'running': "primaryContainer"
-        }
-        
-        card = ft.Card(
-            elevation=1,
-            content=ft.Container(
-                content=ft.Row([
-                    ft.Icon(
-                        icon_name,
-                        size=24,
-                        color="onSurfaceVariant"
-                    ),
-                    ft.Column([
-                        ft.Text(title, size=14, weight=ft.FontWeight.W_500, color="onSurface"),
-                        ft.Text(subtitle, size=12, color="onSurfaceVariant") if subtitle else ft.Container(),
-                    ], spacing=2, expand=True),
-                ], spacing=12),
-                padding=16,
-                bgcolor=colors_map.get(status, "surface"),
-            )
-        )
-        status_cards.controls.insert(0, card)
-        page.update()
-        return card
+        return add_status_cards([(icon_name, title, subtitle, status)])[0]
     
+    # Progress callbacks from tight loops paint at most ~30 times a second,
+    # showing whatever value arrived last
+    PROGRESS_INTERVAL = 0.033
+
     def update_progress(value: float, text: str = ""):
         """Update progress bar"""
         # value can be None for indeterminate
         progress_bar.value = value
         progress_bar.visible = (value is None) or (value < 1.0)
         progress_text.value = text
-        page.update()
+
+        # Start/finish states always paint immediately
+        if value is not None and value < 1.0:
+            request_update(PROGRESS_INTERVAL)
+        else:
+            refresh()
+
+    def watch_progress(job_name: str, stall_seconds: float = 0.5):
+        """update_progress wrapper for a job; warns once if progress stops arriving mid-job.
+
+        Timing starts at the first callback, so setup before it (walking the tree, loading
+        caches, writing locale files) is never taken for a stall. A watchdog timer notices a
+        live stall instead of waiting for the next callback. Must be created from the job's
+        coroutine; the callback itself runs on a pool thread.
+        """
+        loop = asyncio.get_running_loop()
+        last_tick: Optional[float] = None
+        finished = False
+        warned = False
+
+        def arm_watchdog(delay: float):
+            timer = threading.Timer(delay, check_stall)
+            timer.daemon = True
+            timer.start()
+
+        def check_stall():
+            nonlocal warned
+            # Stand down once the job is over or a newer job installed its own watcher
+            if warned or finished or not busy or manager.on_progress is not on_progress:
+                return
+            gap = time.perf_counter() - last_tick
+            if gap < stall_seconds:
+                # Ticks only record the time; the one timer re-arms for what is left
+                arm_watchdog(stall_seconds - gap)
+                return
+            warned = True
+            loop.call_soon_threadsafe(
+                add_status_card,
+                ft.Icons.HOURGLASS_BOTTOM,
+                f"{job_name} stalled for {gap * 1000:.0f} ms",
+                "No progress has been reported since.",
+                "warning",
+            )
+
+        def on_progress(value, text: str = ""):
+            nonlocal last_tick, finished
+            first = last_tick is None
+            last_tick = time.perf_counter()
+            if value is not None and value >= 1.0:
+                finished = True
+            elif first:
+                arm_watchdog(stall_seconds)
+            update_progress(value, text)
+
+        return on_progress
 
     def set_busy(is_busy: bool, text: str = ""):
         nonlocal busy
@@ -1056,49 +1857,75 @@ def main(page: ft.Page):
     language_checks = {}
     language_chips_row = ft.Row(wrap=True, spacing=8)
 
+    # Chips are built once; refreshing only flips their visibility
+    source_chip_label = ft.Text("")
+    source_chip = ft.Chip(label=source_chip_label, disabled=True, bgcolor="surfaceVariant")
+    language_chips: dict[str, ft.Chip] = {}
+    for code, name in sorted_languages:
+        language_chips[code] = ft.Chip(
+            label=ft.Text(name),
+            on_delete=lambda e, l=code: remove_language(l),
+            delete_icon=ft.Icons.CLOSE,
+            bgcolor="secondaryContainer",
+            visible=False,
+        )
+    language_chips_row.controls = [source_chip, *language_chips.values()]
+
     def refresh_language_controls():
         """Refresh language UI controls based on current source_language and selection."""
         # Ensure source language is always selected
-        if source_language not in selected_languages:
+        if source_language not in selected_set:
             selected_languages.append(source_language)
+            selected_set.add(source_language)
 
+        # Only touch checkboxes whose state actually changes
+        locked = busy or (not project_selected)
+        changed = False
         for code, cb in language_checks.items():
-            cb.disabled = busy or (not project_selected) or (code == source_language)
-            cb.value = (code in selected_languages)
+            disabled = locked or (code == source_language)
+            value = code in selected_set
+            if cb.disabled != disabled:
+                cb.disabled = disabled
+                changed = True
+            if cb.value != value:
+                cb.value = value
+                changed = True
+        if changed:
+            request_update()
 
         update_language_chips()
     
+    last_chip_sig: Optional[tuple] = None
+    # Checkbox handlers run on Flet's thread pool; one chip pass at a time
+    chips_lock = threading.Lock()
+
     def update_language_chips():
         """Update selected language chips"""
-        language_chips_row.controls.clear()
-        # Source chip
-        language_chips_row.controls.append(
-            ft.Chip(
-                label=ft.Text(f"{manager.SUPPORTED_LANGUAGES.get(source_language, source_language)} (source)"),
-                disabled=True,
-                bgcolor="surfaceVariant",
-            )
-        )
-
-        # Target chips
-        for lang in selected_languages:
-            if lang != source_language:
-                chip = ft.Chip(
-                    label=ft.Text(manager.SUPPORTED_LANGUAGES.get(lang, lang)),
-                    on_delete=lambda e, l=lang: remove_language(l),
-                    delete_icon=ft.Icons.CLOSE,
-                    bgcolor="secondaryContainer",
-                )
-                language_chips_row.controls.append(chip)
-
-        page.update()
+        nonlocal last_chip_sig
+        with chips_lock:
+            chip_sig = (source_language, tuple(selected_languages))
+            if chip_sig == last_chip_sig:
+                return
+            last_chip_sig = chip_sig
+            source_chip_label.value = f"{manager.SUPPORTED_LANGUAGES.get(source_language, source_language)} (source)"
+            # Visible chips follow selection order; the hidden rest keep their place at the end
+            shown = [code for code in selected_languages if code != source_language and code in language_chips]
+            for code, chip in language_chips.items():
+                chip.visible = code != source_language and code in selected_set
+            language_chips_row.controls = [
+                source_chip,
+                *(language_chips[code] for code in shown),
+                *(chip for code, chip in language_chips.items() if not chip.visible),
+            ]
+        request_update()
     
     def remove_language(lang: str):
         """Remove language"""
         if lang == source_language:
             return
-        if lang in selected_languages:
+        if lang in selected_set:
             selected_languages.remove(lang)
+            selected_set.discard(lang)
             language_checks[lang].value = False
             update_language_chips()
     
@@ -1108,18 +1935,20 @@ def main(page: ft.Page):
             # Source language is always selected
             language_checks[lang].value = True
             return
-        if checked and lang not in selected_languages:
+        if checked and lang not in selected_set:
             selected_languages.append(lang)
-        elif not checked and lang in selected_languages:
+            selected_set.add(lang)
+        elif not checked and lang in selected_set:
             selected_languages.remove(lang)
+            selected_set.discard(lang)
         update_language_chips()
     
     # Create language checkboxes
     lang_column = ft.Column(spacing=4, scroll=ft.ScrollMode.AUTO)
-    for code, name in sorted(manager.SUPPORTED_LANGUAGES.items(), key=lambda x: x[1]):
+    for code, name in sorted_languages:
         cb = ft.Checkbox(
             label=name,
-            value=(code in selected_languages),
+            value=(code in selected_set),
             disabled=True,
             on_change=lambda e, c=code: toggle_language(c, e.control.value)
         )
@@ -1137,10 +1966,11 @@ def main(page: ft.Page):
         manager.source_language = source_language
         refresh_language_controls()
 
+    source_language_options = [ft.dropdown.Option(code, name) for code, name in sorted_languages]
     source_language_dd = ft.Dropdown(
         label="Source language",
         value=source_language,
-        options=[ft.dropdown.Option(code, name) for code, name in sorted(manager.SUPPORTED_LANGUAGES.items(), key=lambda x: x[1])],
+        options=source_language_options,
         on_select=on_source_language_change,
         disabled=True,
         width=260,
@@ -1172,122 +2002,112 @@ def main(page: ft.Page):
         if not selected_path:
             return
 
-        on_folder_selected(selected_path)
+        await on_folder_selected(selected_path)
     
-    def on_folder_selected(selected_path: str):
+    async def on_folder_selected(selected_path: str):
         """Handle folder selection"""
-        nonlocal project_selected
+        nonlocal project_selected, source_language
         if not selected_path:
             return
 
         manager.project_path = Path(selected_path)
         project_path_text.value = str(manager.project_path)
         
-        # Detect project setup
-        for src_name in ['src', 'app', 'client', 'frontend']:
-            src_path = manager.project_path / src_name
-            if src_path.exists():
-                manager.src_dir = src_path
-                break
-        
-        if not manager.src_dir:
-            add_status_card(ft.Icons.ERROR, "No src/ directory found", status="warning")
-            status_text.value = "❌ No src/ directory"
-            page.update()
-            return
+        # Probe the folder on the job pool so slow or network drives don't stall the UI
+        scan = await run_blocking(_scan_project, manager.project_path, supported_codes)
+        manager.src_dir = scan.src_dir
+        framework_info = await run_blocking(manager.detect_framework) if scan.src_dir else None
+        
+        # Several cards and control changes below; paint them once
+        with batched_updates():
+            if not manager.src_dir:
+                # Nothing from a previously selected project may linger
+                project_selected = False
+                manager.locales_dir = None
+                manager.has_i18n_setup = False
+                manager.framework, manager.framework_version = 'Unknown', ''
+                framework_text.value = "Unknown"
+                update_action_availability()
+                refresh_language_controls()
+                add_status_card(ft.Icons.ERROR, "No src/ directory found", status="warning")
+                status_text.value = "❌ No src/ directory"
+                return
 
-        project_selected = True
-        source_language_dd.disabled = busy
-        update_action_availability()
-        
-        # Detect framework
-        framework_info = manager.detect_framework()
-        manager.framework = framework_info['name']
-        manager.framework_version = framework_info['version']
-        
-        framework_display = framework_info['name']
-        if framework_info['version']:
-            framework_display += f" v{framework_info['version']}"
-        framework_text.value = framework_display
-        
-        # Check i18n setup
-        i18n_config = manager.src_dir / 'i18n' / 'config.ts'
-        locales_dir = manager.src_dir / 'i18n' / 'locales'
-        
-        manager.has_i18n_setup = i18n_config.exists() and locales_dir.exists()
-        
-        if manager.has_i18n_setup:
-            manager.locales_dir = locales_dir
+            project_selected = True
+            source_language_dd.disabled = busy
+            update_action_availability()
             
-            # Detect languages
-            stems = [f.stem for f in locales_dir.glob('*.json') if f.stem not in ('index', 'config')]
-
-            supported_codes = set(manager.SUPPORTED_LANGUAGES.keys())
-            inferred_codes: list[str] = []
-            unknown_stems: list[str] = []
-            for stem in stems:
-                code = _infer_lang_from_locale_stem(stem, supported_codes)
-                if code:
-                    inferred_codes.append(code)
-                else:
-                    unknown_stems.append(stem)
-
-            inferred_unique = sorted(set(inferred_codes))
-            if inferred_unique:
-                selected_languages.clear()
-                selected_languages.extend(inferred_unique)
+            # Detect framework
+            manager.framework = framework_info['name']
+            manager.framework_version = framework_info['version']
+            
+            framework_display = framework_info['name']
+            if framework_info['version']:
+                framework_display += f" v{framework_info['version']}"
+            framework_text.value = framework_display
+            
+            # Check i18n setup
+            manager.has_i18n_setup = scan.has_i18n_setup
+            
+            if manager.has_i18n_setup:
+                manager.locales_dir = scan.locales_dir
+                
+                inferred_unique = scan.inferred
+                if inferred_unique:
+                    selected_languages.clear()
+                    selected_languages.extend(inferred_unique)
+                    selected_set.clear()
+                    selected_set.update(inferred_unique)
 
-                for lang in inferred_unique:
-                    if lang in language_checks:
-                        language_checks[lang].value = True
+                    for lang in inferred_unique:
+                        if lang in language_checks:
+                            language_checks[lang].value = True
 
-                # Pick source language from inferred locales if possible
-                nonlocal source_language
-                if 'en' in inferred_unique:
-                    source_language = 'en'
+                    # Pick source language from inferred locales if possible
+                    if 'en' in inferred_unique:
+                        source_language = 'en'
+                    else:
+                        source_language = inferred_unique[0]
+                    manager.source_language = source_language
+                    source_language_dd.value = source_language
+                    refresh_language_controls()
                 else:
-                    source_language = inferred_unique[0]
-                manager.source_language = source_language
-                source_language_dd.value = source_language
-                refresh_language_controls()
-            else:
-                # No recognizable language files; keep defaults and let user choose manually
-                manager.source_language = source_language
-                refresh_language_controls()
+                    # No recognizable language files; keep defaults and let user choose manually
+                    manager.source_language = source_language
+                    refresh_language_controls()
 
-            if unknown_stems:
-                add_status_card(
-                    ft.Icons.INFO,
-                    "Non-standard locale files detected",
-                    f"Found locale JSON files like: {unknown_stems[0]}.json (and {max(0, len(unknown_stems)-1)} more). "
-                    "Auto-detect may be incomplete; choose languages manually.",
-                    "info",
-                )
-            
-            lang_count = len(inferred_unique)
-            subtitle = f"{lang_count} languages detected" if lang_count else f"{len(stems)} locale file(s) found"
-            add_status_card(ft.Icons.CHECK_CIRCLE, "i18n configured", subtitle, "success")
-            status_text.value = "✅ Ready to process"
-            if hasattr(manager, 'setup_card_ref'):
-                manager.setup_card_ref.visible = False
-        else:
-            add_status_card(ft.Icons.WARNING, "i18n not configured", "Setup required", "warning")
-            status_text.value = "⚠️ Setup required"
-            if hasattr(manager, 'setup_card_ref'):
-                manager.setup_card_ref.visible = True
-            # Let the user choose source language / targets first, then click "Initialize i18n"
-        
-        page.update()
+                unknown_stems = scan.unknown
+                if unknown_stems:
+                    add_status_card(
+                        ft.Icons.INFO,
+                        "Non-standard locale files detected",
+                        f"Found locale JSON files like: {unknown_stems[0]}.json (and {max(0, len(unknown_stems)-1)} more). "
+                        "Auto-detect may be incomplete; choose languages manually.",
+                        "info",
+                    )
+                
+                lang_count = len(inferred_unique)
+                subtitle = f"{lang_count} languages detected" if lang_count else f"{len(scan.stems)} locale file(s) found"
+                add_status_card(ft.Icons.CHECK_CIRCLE, "i18n configured", subtitle, "success")
+                status_text.value = "✅ Ready to process"
+                if hasattr(manager, 'setup_card_ref'):
+                    manager.setup_card_ref.visible = False
+            else:
+                add_status_card(ft.Icons.WARNING, "i18n not configured", "Setup required", "warning")
+                status_text.value = "⚠️ Setup required"
+                if hasattr(manager, 'setup_card_ref'):
+                    manager.setup_card_ref.visible = True
+                # Let the user choose source language / targets first, then click "Initialize i18n"
     
     def show_setup_dialog():
         """Show setup dialog"""
         def close_dialog(e):
             dialog.open = False
-            page.update()
+            dialog.update()
         
         def create_setup(e):
             dialog.open = False
-            page.update()
+            dialog.update()
             run_setup()
         
         dialog = ft.AlertDialog(
@@ -1327,11 +2147,11 @@ export default i18n;
 """
             (i18n_dir / 'config.ts').write_text(config_content, encoding='utf-8')
             
-            # Initial locale files
+            # Initial locale files (identical for every language, so serialize once)
             structure = {"common": {}, "nav": {}, "button": {}, "form": {}, "message": {}}
+            payload = _json_bytes(structure)
             for lang in selected_languages:
-                with open(locales_dir / f'{lang}.json', 'w', encoding='utf-8') as f:
-                    json.dump(structure, f, indent=2, ensure_ascii=False)
+                (locales_dir / f'{lang}.json').write_bytes(payload)
             
             # Index file
             (i18n_dir / 'index.ts').write_text("export { default } from './config';\n", encoding='utf-8')
@@ -1351,7 +2171,7 @@ export default i18n;
             
             def close_info_dialog():
                 info_dialog.open = False
-                page.update()
+                info_dialog.update()
             
             page.overlay.append(info_dialog)
             info_dialog.open = True
@@ -1359,6 +2179,52 @@ export default i18n;
         except Exception as ex:
             add_status_card(ft.Icons.ERROR, "Setup failed", str(ex), "warning")
     
+    # Background jobs run as asyncio tasks on the page's event loop, one at a time;
+    # only the blocking manager calls are handed to the shared pool
+    job_running = False
+    job_lock = threading.Lock()
+
+    async def run_blocking(fn, *args):
+        """Run a blocking call on the shared pool without stalling the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(_JOB_EXECUTOR, fn, *args)
+
+    def submit_job(name: str, job) -> bool:
+        """Start an async job; rejected while another job is in flight."""
+        nonlocal job_running
+        with job_lock:
+            if job_running:
+                add_status_card(ft.Icons.INFO, "Busy, please wait...", "Another task is still running.", "info")
+                return False
+            job_running = True
+
+        async def run_job():
+            nonlocal job_running
+            try:
+                await job()
+            except Exception as ex:
+                add_status_card(ft.Icons.ERROR, f"{name} failed: {str(ex)}", status="warning")
+            finally:
+                with job_lock:
+                    job_running = False
+
+        page.run_task(run_job)
+        return True
+
+    # Clicks on any action button within this window of the last one are dropped
+    ACTION_CLICK_INTERVAL = 0.3
+    last_action_click = 0.0
+
+    def throttled_action(action):
+        """Wrap a run_* click handler so double clicks dispatch only once"""
+        def on_click(e):
+            nonlocal last_action_click
+            now = time.monotonic()
+            if busy or now - last_action_click < ACTION_CLICK_INTERVAL:
+                return
+            last_action_click = now
+            return action(e)
+        return on_click
+
     # Workflow actions
     def run_detect(e):
         """Run detection"""
@@ -1368,13 +2234,13 @@ export default i18n;
             add_status_card(ft.Icons.ERROR, "Please select a project first", status="warning")
             return
         
-        def worker():
+        async def worker():
             try:
                 set_busy(True, "Detecting hardcoded text...")
                 add_status_card(ft.Icons.SEARCH, "Detecting hardcoded text...", status="running")
-                manager.on_progress = update_progress
+                manager.on_progress = watch_progress("Detection")
                 
-                strings = manager.detect_hardcoded_text(manager.src_dir)
+                strings = await run_blocking(manager.detect_hardcoded_text, manager.src_dir)
                 manager.detected_strings = strings
 
                 render_detect_results()
@@ -1386,7 +2252,7 @@ export default i18n;
             finally:
                 set_busy(False, "")
         
-        threading.Thread(target=worker, daemon=True).start()
+        submit_job("Detection", worker)
     
     def run_generate(e):
         """Generate keys"""
@@ -1396,13 +2262,13 @@ export default i18n;
             add_status_card(ft.Icons.ERROR, "No detected strings. Run 'Detect Text' first", status="warning")
             return
         
-        def worker():
+        async def worker():
             try:
                 set_busy(True, "Generating translation keys...")
                 add_status_card(ft.Icons.KEY, "Generating translation keys...", status="running")
-                manager.on_progress = update_progress
+                manager.on_progress = watch_progress("Key generation")
                 
-                mapping = manager.generate_translation_keys(manager.detected_strings)
+                mapping = await run_blocking(manager.generate_translation_keys, manager.detected_strings)
                 manager.generated_keys = mapping
 
                 render_generated_keys()
@@ -1414,7 +2280,7 @@ export default i18n;
             finally:
                 set_busy(False, "")
         
-        threading.Thread(target=worker, daemon=True).start()
+        submit_job("Key generation", worker)
     
     def run_sync(e):
         """Sync keys"""
@@ -1424,12 +2290,12 @@ export default i18n;
             add_status_card(ft.Icons.ERROR, "Please select a project with i18n setup first", status="warning")
             return
         
-        def worker():
+        async def worker():
             try:
                 set_busy(True, "Syncing translation keys...")
                 add_status_card(ft.Icons.SYNC, "Synchronizing translation keys...", status="running")
                 
-                manager.sync_translation_keys()
+                await run_blocking(manager.sync_translation_keys)
                 
                 add_status_card(ft.Icons.CHECK_CIRCLE, f"Synced keys across {len(selected_languages)} languages", status="success")
             except Exception as ex:
@@ -1437,7 +2303,7 @@ export default i18n;
             finally:
                 set_busy(False, "")
         
-        threading.Thread(target=worker, daemon=True).start()
+        submit_job("Sync", worker)
     
     def run_translate(e):
         """Run translation"""
@@ -1450,15 +2316,16 @@ export default i18n;
             add_status_card(ft.Icons.ERROR, "Please select a project with i18n setup first", status="warning")
             return
         
-        def worker():
+        async def worker():
             try:
                 set_busy(True, "Translating...")
                 add_status_card(ft.Icons.TRANSLATE, f"Translating to {len(selected_languages)} languages...", status="running")
                 
                 manager.selected_languages = selected_languages
                 manager.source_language = source_language
-                manager.on_progress = update_progress
-                manager.translate_to_languages(manager.generated_keys, selected_languages)
+                # Progress ticks once per language here, and each is a network round-trip
+                manager.on_progress = watch_progress("Translation", stall_seconds=15.0)
+                await run_blocking(manager.translate_to_languages, manager.generated_keys, selected_languages)
                 
                 add_status_card(ft.Icons.CHECK_CIRCLE, f"Translated to {len(selected_languages)} languages", status="success")
             except Exception as ex:
@@ -1466,7 +2333,7 @@ export default i18n;
             finally:
                 set_busy(False, "")
         
-        threading.Thread(target=worker, daemon=True).start()
+        submit_job("Translation", worker)
     
     def run_replace(e):
         """Run code replacement"""
@@ -1479,12 +2346,13 @@ export default i18n;
             add_status_card(ft.Icons.ERROR, "Please select a project with i18n setup first", status="warning")
             return
         
-        def worker():
+        async def worker():
             try:
                 set_busy(True, "Updating source code...")
                 add_status_card(ft.Icons.EDIT, "Updating source code...", status="running")
+                manager.on_progress = watch_progress("Replacement")
                 
-                manager.replace_in_source_code(manager.generated_keys)
+                await run_blocking(manager.replace_in_source_code, manager.generated_keys)
                 
                 add_status_card(ft.Icons.CHECK_CIRCLE, "Code replacement complete!", status="success")
             except Exception as ex:
@@ -1492,7 +2360,7 @@ export default i18n;
             finally:
                 set_busy(False, "")
         
-        threading.Thread(target=worker, daemon=True).start()
+        submit_job("Replacement", worker)
     
     def run_validate(e):
         """Run validation"""
@@ -1502,87 +2370,90 @@ export default i18n;
             add_status_card(ft.Icons.ERROR, "Please select a project with i18n setup first", status="warning")
             return
         
-        def worker():
+        async def worker():
             try:
                 set_busy(True, "Validating translations...")
                 add_status_card(ft.Icons.VERIFIED, "Validating translations...", status="running")
                 
                 # Check for duplicate keys
-                locale_results = manager.validate_locale_files()
+                locale_results = await run_blocking(manager.validate_locale_files)
+                
+                with batched_updates():
+                    if not locale_results.get('valid'):
+                        total_duplicates = sum(s.get('duplicate_count', 0) for s in locale_results.get('stats', {}).values())
+                        if total_duplicates > 0:
+                            add_status_card(
+                                ft.Icons.WARNING_AMBER, 
+                                f"Found {total_duplicates} duplicate keys!", 
+                                "Click 'Remove Duplicates' button to clean up.",
+                                status="warning"
+                            )
+                        
+                            # Show stats per language
+                            for lang, stats in locale_results.get('stats', {}).items():
+                                if stats.get('duplicate_count', 0) > 0:
+                                    add_status_card(
+                                        ft.Icons.COPY_ALL,
+                                        f"{lang}.json: {stats['total_keys']} keys → {stats['unique_values']} unique values",
+                                        f"{stats['duplicate_count']} duplicates found",
+                                        status="info"
+                                    )
+                    else:
+                        add_status_card(ft.Icons.CHECK_CIRCLE, "No duplicate keys found!", status="success")
+                
+                # Check for unused keys
+                update_progress(0.3, "Checking for unused keys...")
+                unused_keys = await run_blocking(manager.find_unused_translation_keys)
                 
-                if not locale_results.get('valid'):
-                    total_duplicates = sum(s.get('duplicate_count', 0) for s in locale_results.get('stats', {}).values())
-                    if total_duplicates > 0:
+                with batched_updates():
+                    if unused_keys:
+                        total_unused = sum(len(keys) for keys in unused_keys.values())
                         add_status_card(
-                            ft.Icons.WARNING_AMBER, 
-                            f"Found {total_duplicates} duplicate keys!", 
-                            "Click 'Remove Duplicates' button to clean up.",
+                            ft.Icons.DELETE_SWEEP,
+                            f"Found {total_unused} unused translation keys!",
+                            "These keys exist in locale files but are not used in code. Click 'Archive Unused Keys' to move them.",
                             status="warning"
                         )
-                        
+                    
                         # Show stats per language
-                        for lang, stats in locale_results.get('stats', {}).items():
-                            if stats.get('duplicate_count', 0) > 0:
+                        for lang, keys in unused_keys.items():
+                            if len(keys) <= 10:
                                 add_status_card(
-                                    ft.Icons.COPY_ALL,
-                                    f"{lang}.json: {stats['total_keys']} keys → {stats['unique_values']} unique values",
-                                    f"{stats['duplicate_count']} duplicates found",
+                                    ft.Icons.INFO,
+                                    f"{lang}.json: {len(keys)} unused keys",
+                                    f"Keys: {', '.join(keys[:5])}{'...' if len(keys) > 5 else ''}",
                                     status="info"
                                 )
-                else:
-                    add_status_card(ft.Icons.CHECK_CIRCLE, "No duplicate keys found!", status="success")
-                
-                # Check for unused keys
-                update_progress(0.3, "Checking for unused keys...")
-                unused_keys = manager.find_unused_translation_keys()
-                
-                if unused_keys:
-                    total_unused = sum(len(keys) for keys in unused_keys.values())
-                    add_status_card(
-                        ft.Icons.DELETE_SWEEP,
-                        f"Found {total_unused} unused translation keys!",
-                        "These keys exist in locale files but are not used in code. Click 'Archive Unused Keys' to move them.",
-                        status="warning"
-                    )
-                    
-                    # Show stats per language
-                    for lang, keys in unused_keys.items():
-                        if len(keys) <= 10:
-                            add_status_card(
-                                ft.Icons.INFO,
-                                f"{lang}.json: {len(keys)} unused keys",
-                                f"Keys: {', '.join(keys[:5])}{'...' if len(keys) > 5 else ''}",
-                                status="info"
-                            )
-                        else:
-                            add_status_card(
-                                ft.Icons.INFO,
-                                f"{lang}.json: {len(keys)} unused keys",
-                                f"Sample: {', '.join(keys[:3])}...",
-                                status="info"
-                            )
-                else:
-                    add_status_card(ft.Icons.CHECK_CIRCLE, "No unused keys found!", status="success")
+                            else:
+                                add_status_card(
+                                    ft.Icons.INFO,
+                                    f"{lang}.json: {len(keys)} unused keys",
+                                    f"Sample: {', '.join(keys[:3])}...",
+                                    status="info"
+                                )
+                    else:
+                        add_status_card(ft.Icons.CHECK_CIRCLE, "No unused keys found!", status="success")
                 
                 # Check for missing translations
                 update_progress(0.6, "Checking for missing translations...")
-                results = manager.validate_translations()
+                results = await run_blocking(manager.validate_translations)
                 
-                if 'error' in results:
-                    add_status_card(ft.Icons.ERROR, results['error'], status="warning")
-                else:
-                    total_missing = sum(len(r['missing']) for r in results.values())
-                    if total_missing == 0:
-                        add_status_card(ft.Icons.CHECK_CIRCLE, "All translations complete!", status="success")
+                with batched_updates():
+                    if 'error' in results:
+                        add_status_card(ft.Icons.ERROR, results['error'], status="warning")
                     else:
-                        add_status_card(ft.Icons.WARNING, f"{total_missing} missing translations", status="warning")
-                        for lang, data in results.items():
-                            if data['missing']:
-                                add_status_card(
-                                    ft.Icons.WARNING,
-                                    f"{manager.SUPPORTED_LANGUAGES[lang]}: {len(data['missing'])} missing",
-                                    status="warning"
-                                )
+                        total_missing = sum(len(r['missing']) for r in results.values())
+                        if total_missing == 0:
+                            add_status_card(ft.Icons.CHECK_CIRCLE, "All translations complete!", status="success")
+                        else:
+                            add_status_card(ft.Icons.WARNING, f"{total_missing} missing translations", status="warning")
+                            for lang, data in results.items():
+                                if data['missing']:
+                                    add_status_card(
+                                        ft.Icons.WARNING,
+                                        f"{manager.SUPPORTED_LANGUAGES[lang]}: {len(data['missing'])} missing",
+                                        status="warning"
+                                    )
                 
                 update_progress(1.0, "Validation complete")
             except Exception as ex:
@@ -1590,7 +2461,7 @@ export default i18n;
             finally:
                 set_busy(False, "")
         
-        threading.Thread(target=worker, daemon=True).start()
+        submit_job("Validation", worker)
     
     def run_archive_unused(e):
         """Archive unused translation keys"""
@@ -1600,20 +2471,20 @@ export default i18n;
             add_status_card(ft.Icons.ERROR, "Please select a project with i18n setup first", status="warning")
             return
         
-        def worker():
+        async def worker():
             try:
                 set_busy(True, "Archiving unused keys...")
                 add_status_card(ft.Icons.DELETE_SWEEP, "Finding and archiving unused keys...", status="running")
                 
                 # Find unused keys
-                unused_keys = manager.find_unused_translation_keys()
+                unused_keys = await run_blocking(manager.find_unused_translation_keys)
                 
                 if not unused_keys:
                     add_status_card(ft.Icons.INFO, "No unused keys to archive", status="info")
                     return
                 
                 # Archive them
-                archived_count = manager.archive_unused_keys(unused_keys)
+                archived_count = await run_blocking(manager.archive_unused_keys, unused_keys)
                 
                 if archived_count > 0:
                     add_status_card(
@@ -1629,7 +2500,7 @@ export default i18n;
             finally:
                 set_busy(False, "")
         
-        threading.Thread(target=worker, daemon=True).start()
+        submit_job("Archive", worker)
     
     def run_remove_duplicates(e):
         """Remove duplicate keys from locale files"""
@@ -1639,12 +2510,12 @@ export default i18n;
             add_status_card(ft.Icons.ERROR, "Please select a project with i18n setup first", status="warning")
             return
         
-        def worker():
+        async def worker():
             try:
                 set_busy(True, "Removing duplicates...")
                 add_status_card(ft.Icons.CLEANING_SERVICES, "Removing duplicate keys...", status="running")
                 
-                removed = manager.remove_duplicate_keys_from_locales()
+                removed = await run_blocking(manager.remove_duplicate_keys_from_locales)
                 
                 if removed > 0:
                     add_status_card(
@@ -1660,43 +2531,58 @@ export default i18n;
             finally:
                 set_busy(False, "")
         
-        threading.Thread(target=worker, daemon=True).start()
+        submit_job("Cleanup", worker)
 
     # Review UI state (Detect + Generate)
+    # Result tiles are built a page at a time; scrolling near the end appends the next page
+    RESULTS_PAGE_SIZE = 40
+    # Scroll events arrive on Flet's handler threads; a page is appended under this lock so two
+    # events can't both read the same length and append the same page twice
+    results_lock = threading.Lock()
+    
+    def near_end(e) -> bool:
+        return e.pixels is not None and e.max_scroll_extent is not None and e.pixels >= e.max_scroll_extent - 200
+
     detect_summary = ft.Text("No results yet.", color="onSurfaceVariant")
-    detect_results_list = ft.ListView(expand=True, spacing=6, height=360)
+    detect_results_list = ft.ListView(expand=True, spacing=6, height=360, on_scroll=lambda e: on_detect_scroll(e))
 
-    def render_detect_results():
-        detect_results_list.controls.clear()
-        total = len(manager.detected_strings or [])
-        shown = min(total, 300)
-        detect_summary.value = f"Showing {shown} of {total} result(s)" if total else "No results yet."
-
-        for item in (manager.detected_strings or [])[:shown]:
-            file_short = Path(item.get('file', '')).name
-            line_no = item.get('line', '?')
-            ctx = item.get('context', '')
-            text = item.get('text', '')
+    def append_detect_page():
+        items = manager.detected_strings or []
+        start = len(detect_results_list.controls)
+        # Only one page of tiles is built at a time, so the file name is derived here
+        for item in items[start:start + RESULTS_PAGE_SIZE]:
             detect_results_list.controls.append(
                 ft.ListTile(
-                    title=ft.Text(text, max_lines=2, overflow=ft.TextOverflow.ELLIPSIS),
-                    subtitle=ft.Text(f"{file_short}:{line_no} · {ctx}", color="onSurfaceVariant"),
+                    title=ft.Text(item.text, max_lines=2, overflow=ft.TextOverflow.ELLIPSIS),
+                    subtitle=ft.Text(f"{os.path.basename(item.file)}:{item.line} · {item.context}", color="onSurfaceVariant"),
                     dense=True,
                 )
             )
+        total = len(items)
+        detect_summary.value = f"Showing {len(detect_results_list.controls)} of {total} result(s)" if total else "No results yet."
 
-        page.update()
+    def render_detect_results():
+        with results_lock:
+            detect_results_list.controls.clear()
+            append_detect_page()
+        refresh()
 
-    keys_summary = ft.Text("No keys yet.", color="onSurfaceVariant")
-    keys_results_list = ft.ListView(expand=True, spacing=6, height=360)
+    def on_detect_scroll(e):
+        if not near_end(e):
+            return
+        with results_lock:
+            if len(detect_results_list.controls) >= len(manager.detected_strings or []):
+                return
+            append_detect_page()
+        refresh()
 
-    def render_generated_keys():
-        keys_results_list.controls.clear()
-        total = len(manager.generated_keys or {})
-        shown = min(total, 300)
-        keys_summary.value = f"Showing {shown} of {total} key(s)" if total else "No keys yet."
+    keys_summary = ft.Text("No keys yet.", color="onSurfaceVariant")
+    keys_results_list = ft.ListView(expand=True, spacing=6, height=360, on_scroll=lambda e: on_keys_scroll(e))
+    keys_items: list = []
 
-        for key, info in list((manager.generated_keys or {}).items())[:shown]:
+    def append_keys_page():
+        start = len(keys_results_list.controls)
+        for key, info in keys_items[start:start + RESULTS_PAGE_SIZE]:
             text = (info or {}).get('text', '')
             keys_results_list.controls.append(
                 ft.ListTile(
@@ -1705,8 +2591,25 @@ export default i18n;
                     dense=True,
                 )
             )
+        total = len(keys_items)
+        keys_summary.value = f"Showing {len(keys_results_list.controls)} of {total} key(s)" if total else "No keys yet."
 
-        page.update()
+    def render_generated_keys():
+        nonlocal keys_items
+        with results_lock:
+            keys_results_list.controls.clear()
+            keys_items = list((manager.generated_keys or {}).items())
+            append_keys_page()
+        refresh()
+
+    def on_keys_scroll(e):
+        if not near_end(e):
+            return
+        with results_lock:
+            if len(keys_results_list.controls) >= len(keys_items):
+                return
+            append_keys_page()
+        refresh()
     
     # Navigation rail with Material Design 3 icons
     rail = ft.NavigationRail(
@@ -1759,26 +2662,18 @@ export default i18n;
     
     def switch_view(index: int):
         """Switch content view"""
-        if index != 0 and not manager.project_path:
+        if index != 0 and not project_selected:
             add_status_card(ft.Icons.INFO, "Select a project first", "Project selection is required before using tools.", "info")
             rail.selected_index = 0
-            content_area.content = create_project_view()
+            content_area.content = views[0]
             page.update()
             return
         rail.selected_index = index
         
-        views = [
-            create_project_view(),
-            create_detect_view(),
-            create_generate_view(),
-            create_action_view("Sync Translation Keys", "Synchronize translation keys across all language files.", ft.Icons.SYNC, run_sync),
-            create_action_view("Auto-Translate", "Automatically translate all keys to selected languages using Google Translate.", ft.Icons.TRANSLATE, run_translate),
-            create_action_view("Update Source Code", "Replace hardcoded text in your source code with t() function calls.", ft.Icons.EDIT, run_replace),
-            create_action_view("Validate Translations", "Check translation completeness and find missing translations.", ft.Icons.VERIFIED, run_validate),
-        ]
-        
+        # Views are built once at startup; switching only swaps the cached tree,
+        # so only the content area needs to be sent
         content_area.content = views[index]
-        page.update()
+        content_area.update()
     
     def create_project_view():
         """Project configuration view"""
@@ -1788,41 +2683,42 @@ export default i18n;
             run_btn = ft.FilledButton(
                 "Run",
                 icon=ft.Icons.PLAY_ARROW,
-                on_click=on_click,
+                on_click=throttled_action(on_click),
                 width=float("inf"),
-                disabled=(not project_selected) or busy,
+                disabled=not actions_enabled,
             )
             action_run_buttons.append(run_btn)
             return ft.Container(
+                # Text block on top, button pinned to the bottom of the fixed-height card
                 content=ft.Column([
-                    ft.Icon(icon, size=40, color="primary"),
-                    ft.Text(title, size=18, weight=ft.FontWeight.BOLD, color="onSurface"),
-                    ft.Text(description, size=12, color="onSurfaceVariant", no_wrap=False, max_lines=3, overflow=ft.TextOverflow.ELLIPSIS),
-                    ft.Container(expand=True), # Spacer
+                    ft.Column([
+                        ft.Icon(icon, size=40, color="primary"),
+                        ft.Text(title, size=18, weight=ft.FontWeight.BOLD, color="onSurface"),
+                        ft.Text(description, size=12, color="onSurfaceVariant", no_wrap=False, max_lines=3, overflow=ft.TextOverflow.ELLIPSIS),
+                    ], spacing=10),
                     run_btn
-                ], spacing=10),
+                ], spacing=10, alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
                 padding=20,
                 bgcolor="surface",
                 border_radius=16,
-                shadow=ft.BoxShadow(
-                    spread_radius=1,
-                    blur_radius=10,
-                    color=ft.Colors.with_opacity(0.1, ft.Colors.BLACK),
-                    offset=ft.Offset(0, 4),
-                ),
-                animate=ft.Animation(300, "easeOut"),
-                on_hover=lambda e: highlight_card(e),
-                col={"sm": 12, "md": 6, "xl": 4}, # Responsive grid
+                shadow=_CARD_SHADOW,
+                animate=_CARD_ANIMATION,
+                on_hover=highlight_card,
+                col=_CARD_COL,
                 height=240,
             )
 
         def highlight_card(e):
-            e.control.shadow.blur_radius = 20 if e.data == "true" else 10
-            e.control.shadow.spread_radius = 2 if e.data == "true" else 1
-            e.control.update()
+            card = e.control
+            shadow = _CARD_SHADOW_HOVER if e.data == "true" else _CARD_SHADOW
+            key = ("hover", id(card))
+            # Already showing it, and no opposite state queued: nothing to paint
+            if card.shadow is shadow and not op_pending(key):
+                return
+            # Enter/leave bursts on one card collapse to the final state; only the card updates
+            schedule_op(key, lambda: setattr(card, "shadow", shadow), control=card)
 
         # Grid of actions
-        action_run_buttons.clear()
         actions_grid = ft.ResponsiveRow([
             create_action_card("Detect Text", "Scan project for hardcoded strings.", ft.Icons.SEARCH, run_detect),
             create_action_card("Generate Keys", "Create semantic translation keys.", ft.Icons.KEY, run_generate),
@@ -1902,6 +2798,14 @@ export default i18n;
     
     def create_action_view(title: str, description: str, icon_name: str, action):
         """Create action view"""
+        run_btn = ft.FilledButton(
+            title,
+            icon=icon_name,
+            on_click=throttled_action(action),
+            height=48,
+            disabled=not actions_enabled,
+        )
+        action_run_buttons.append(run_btn)
         return ft.Column([
             ft.Text(title, size=28, weight=ft.FontWeight.BOLD, color="onSurface"),
             
@@ -1911,13 +2815,7 @@ export default i18n;
                     content=ft.Column([
                         ft.Icon(icon_name, size=48, color="primary"),
                         ft.Text(description, size=14, color="onSurface"),
-                        ft.FilledButton(
-                            title,
-                            icon=icon_name,
-                            on_click=action,
-                            height=48,
-                            disabled=(not project_selected) or busy,
-                        ),
+                        run_btn,
                     ], spacing=20, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
                     padding=40,
                     bgcolor="surface",
@@ -1927,17 +2825,19 @@ export default i18n;
         ], spacing=16, scroll=ft.ScrollMode.AUTO, horizontal_alignment=ft.CrossAxisAlignment.CENTER)
 
     def create_detect_view():
+        run_btn = ft.FilledButton(
+            "Detect",
+            icon=ft.Icons.SEARCH,
+            on_click=throttled_action(run_detect),
+            height=48,
+            disabled=not actions_enabled,
+        )
+        action_run_buttons.append(run_btn)
         return ft.Column(
             [
                 ft.Text("Detect Hardcoded Text", size=28, weight=ft.FontWeight.BOLD, color="onSurface"),
                 ft.Text("Run detection, then review what was found.", color="onSurfaceVariant"),
-                ft.FilledButton(
-                    "Detect",
-                    icon=ft.Icons.SEARCH,
-                    on_click=run_detect,
-                    height=48,
-                    disabled=(not project_selected) or busy,
-                ),
+                run_btn,
                 ft.Divider(height=16, color="transparent"),
                 ft.Text("Results", size=18, weight=ft.FontWeight.BOLD, color="onSurface"),
                 detect_summary,
@@ -1948,17 +2848,19 @@ export default i18n;
         )
 
     def create_generate_view():
+        run_btn = ft.FilledButton(
+            "Generate",
+            icon=ft.Icons.KEY,
+            on_click=throttled_action(run_generate),
+            height=48,
+            disabled=not actions_enabled,
+        )
+        action_run_buttons.append(run_btn)
         return ft.Column(
             [
                 ft.Text("Generate Translation Keys", size=28, weight=ft.FontWeight.BOLD, color="onSurface"),
                 ft.Text("Generate keys from detected strings, then review the mapping.", color="onSurfaceVariant"),
-                ft.FilledButton(
-                    "Generate",
-                    icon=ft.Icons.KEY,
-                    on_click=run_generate,
-                    height=48,
-                    disabled=(not project_selected) or busy,
-                ),
+                run_btn,
                 ft.Divider(height=16, color="transparent"),
                 ft.Text("Generated Keys", size=18, weight=ft.FontWeight.BOLD, color="onSurface"),
                 keys_summary,
@@ -1982,24 +2884,42 @@ export default i18n;
         bgcolor="surface",
     )
     
-    # Initialize
-    update_language_chips()
-    refresh_language_controls()
-    content_area.content = create_project_view()
-    
-    # Welcome cards
-    add_status_card(ft.Icons.CELEBRATION, "Welcome to i18n Manager", "Material Design 3 Edition", "success")
-    add_status_card(ft.Icons.INFO, "Select a React/TypeScript project to begin", status="info")
+    # Initialize (one paint for the whole startup state)
+    with batched_updates():
+        update_language_chips()
+        refresh_language_controls()
+        
+        # Every view is built once; their run buttons all register in action_run_buttons
+        views = [
+            create_project_view(),
+            create_detect_view(),
+            create_generate_view(),
+            create_action_view("Sync Translation Keys", "Synchronize translation keys across all language files.", ft.Icons.SYNC, run_sync),
+            create_action_view("Auto-Translate", "Automatically translate all keys to selected languages using Google Translate.", ft.Icons.TRANSLATE, run_translate),
+            create_action_view("Update Source Code", "Replace hardcoded text in your source code with t() function calls.", ft.Icons.EDIT, run_replace),
+            create_action_view("Validate Translations", "Check translation completeness and find missing translations.", ft.Icons.VERIFIED, run_validate),
+        ]
+        content_area.content = views[0]
+        
+        # Welcome cards
+        add_status_cards([
+            (ft.Icons.CELEBRATION, "Welcome to i18n Manager", "Material Design 3 Edition", "success"),
+            (ft.Icons.INFO, "Select a React/TypeScript project to begin", "", "info"),
+        ])
     
     async def close_app(e):
         """Properly close the app and terminate all processes"""
+        # Destroy exactly once; the sync call is only a fallback for older Flet
         try:
-            await page.window.destroy_async()
-        except:
-            pass
-        page.window.destroy()
-        import sys
-        sys.exit(0)
+            try:
+                await page.window.destroy_async()
+            except (AttributeError, RuntimeError):
+                page.window.destroy()
+        finally:
+            # Whatever the window did, drop queued work (exit then only waits for a call
+            # already running) and leave
+            _JOB_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+            sys.exit(0)
 
     # Layout with AppBar
     # Custom Window Drag Area
@@ -2044,10 +2964,20 @@ export default i18n;
         ], spacing=0, expand=True)
     )
     
+    theme_target = page.theme_mode
+
+    def set_theme(mode):
+        """Switch theme at the next frame; no-op if it is already shown or pending"""
+        nonlocal theme_target
+        if mode == theme_target:
+            return
+        theme_target = mode
+        schedule_op("theme", lambda: setattr(page, "theme_mode", mode))
+
     def toggle_theme():
         """Toggle light/dark theme"""
-        page.theme_mode = ft.ThemeMode.DARK if page.theme_mode == ft.ThemeMode.LIGHT else ft.ThemeMode.LIGHT
-        page.update()
+        # Flip the pending target so a double toggle within a frame paints nothing new
+        set_theme(ft.ThemeMode.DARK if theme_target == ft.ThemeMode.LIGHT else ft.ThemeMode.LIGHT)
 
 
 if __name__ == '__main__':